@@ -1,16 +1,279 @@
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+
 import frappe
 import requests
 
+from validation.customization.customer_address import propagate_territory_to_customers
+from validation.customization.territory import ensure_territory_chains, get_territory_chain
+from validation.validation.doctype.pincode_post_office.pincode_post_office import (
+    get_post_offices,
+    save_post_offices,
+)
+
 # For Doc Event Hook (Address after_insert)
 def fetch_post_offices_on_save(doc, method):
-    if doc.pincode:
-        post_offices = get_post_offices_api(doc.pincode)
+    """Queue post office enrichment so the insert never waits on a lookup."""
+    if not doc.pincode or doc.country != "India" or (doc.custom_post_office and doc.custom_taluk):
+        return
+
+    if frappe.flags.addresses_pending_enrichment is None:
+        frappe.flags.addresses_pending_enrichment = []
+    frappe.flags.addresses_pending_enrichment.append(doc.name)
+
+    # The first callback to run after commit takes the whole batch, e.g. a Data Import chunk
+    frappe.db.after_commit.add(enqueue_address_enrichment)
+    # Rolled back addresses never exist, so they must not linger into the next commit
+    frappe.db.after_rollback.add(discard_address_enrichment)
+
+
+def discard_address_enrichment():
+    frappe.flags.addresses_pending_enrichment = None
+
+
+def enqueue_address_enrichment():
+    names = frappe.flags.addresses_pending_enrichment
+    frappe.flags.addresses_pending_enrichment = None
+    if names:
+        frappe.enqueue("validation.customization.address.enrich_addresses", queue="short", names=names)
+
+
+def enrich_addresses(names):
+    """Fill empty post office and taluk fields, looking each distinct pincode up once."""
+    addresses = frappe.get_all(
+        "Address",
+        filters={"name": ["in", names]},
+        fields=["name", "pincode", "state", "county", "custom_post_office", "custom_taluk", "territory"]
+    )
+
+    by_pincode = defaultdict(list)
+    for address in addresses:
+        if address.pincode and not (address.custom_post_office and address.custom_taluk):
+            by_pincode[address.pincode.strip()].append(address)
+
+    updates = {}
+    for pincode, rows in by_pincode.items():
+        values = get_enrichment_values(lookup_post_offices(pincode))
+        for row in rows:
+            update = {fieldname: value for fieldname, value in values.items() if not row.get(fieldname)}
+            if update:
+                row.update(update)
+                updates[row.name] = (row, update)
+
+    if updates:
+        set_enriched_territories(updates)
+
+    for row, update in updates.values():
+        frappe.db.set_value("Address", row.name, update, update_modified=False)
+
+
+def set_enriched_territories(updates):
+    """Redo ensure_territory_from_address for enriched rows, which set_value saves without hooks."""
+    chains = {}
+    for name, (row, update) in updates.items():
+        chain = get_territory_chain(row)
+        if len(chain) >= 2 and chain[-1] != row.territory:
+            chains[name] = chain
+    if not chains:
+        return
+
+    ensure_territory_chains(list(chains.values()))
+
+    customers = defaultdict(list)
+    for link in frappe.get_all(
+        "Dynamic Link",
+        filters={"parenttype": "Address", "parent": ["in", list(chains)], "link_doctype": "Customer"},
+        fields=["parent", "link_name"]
+    ):
+        customers[link.parent].append(link.link_name)
+
+    for name, chain in chains.items():
+        row, update = updates[name]
+        row.territory = update["territory"] = chain[-1]
+        propagate_territory_to_customers(row, customers[name])
+
+
+def get_enrichment_values(offices):
+    """Only return values every office of the pincode agrees on."""
+    values = {}
+    if len(offices) == 1:
+        values["custom_post_office"] = offices[0].get("post_office")
+
+    taluks = {office.get("taluk") for office in offices}
+    if len(taluks) == 1:
+        values["custom_taluk"] = taluks.pop()
+
+    return {fieldname: value for fieldname, value in values.items() if value}
 
 @frappe.whitelist()
 def get_post_offices_api(pincode):
+    return lookup_post_offices(pincode)
+
+
+POST_OFFICE_CACHE_KEY = "pincode_post_offices"
+POST_OFFICE_STATS_KEY = "pincode_post_offices_stats"
+STATS_FLUSH_INTERVAL = 100
+
+
+class TTLCache:
+    """Thread-safe in-process LRU whose entries expire after their own TTL."""
+
+    MISSING = object()
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return self.MISSING
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return self.MISSING
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, maxsize):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# First tier, shared by every request in this worker; keys include the site
+_post_office_cache = TTLCache()
+# Hit/miss counts not yet pushed to Redis, per site
+_pending_stats = {}
+
+
+def lookup_post_offices(pincode):
+    """Resolve a pincode through the in-process LRU, Redis, the local directory and finally the API.
+
+    Empty results (unknown pincodes, API failures) are cached for the shorter negative TTL,
+    in Redis only so that clear_post_office_caches reaches every worker. Callers get
+    copies, never the cached objects.
+    """
+    pincode = (pincode or "").strip()
     if not pincode:
         return []
 
+    local_key = (frappe.local.site, pincode)
+    offices = _post_office_cache.get(local_key)
+    if offices is not TTLCache.MISSING:
+        _count("memory_hits")
+        return _copy_offices(offices)
+
+    settings = frappe.get_cached_doc("Settings for Automation")
+    redis_key = f"{POST_OFFICE_CACHE_KEY}:{pincode}"
+    offices = frappe.cache().get_value(redis_key, expires=True)
+    if offices is not None:
+        _count("redis_hits", negative=not offices)
+    else:
+        _count("misses")
+        offices = resolve_post_offices(pincode)
+        # Without a remote fetch an empty result only means "not imported yet"
+        if offices or can_fetch_remote():
+            frappe.cache().set_value(redis_key, offices, expires_in_sec=_cache_ttl(settings, offices))
+
+    if offices:
+        _post_office_cache.set(local_key, offices, _cache_ttl(settings, offices), settings.pincode_cache_size or 2048)
+    return _copy_offices(offices)
+
+
+def _copy_offices(offices):
+    return [office.copy() for office in offices]
+
+
+def clear_post_office_cache(pincode):
+    clear_post_office_caches([pincode])
+
+
+def clear_post_office_caches(pincodes):
+    if not pincodes:
+        return
+
+    for pincode in pincodes:
+        _post_office_cache.pop((frappe.local.site, pincode))
+    frappe.cache().delete_value([f"{POST_OFFICE_CACHE_KEY}:{pincode}" for pincode in pincodes])
+
+
+def _cache_ttl(settings, offices):
+    if offices:
+        return settings.pincode_cache_ttl or 86400
+    return settings.pincode_negative_cache_ttl or 300
+
+
+def _count(event, negative=False):
+    stats = _pending_stats.setdefault(frappe.local.site, Counter())
+    stats[event] += 1
+    if negative:
+        stats["negative_hits"] += 1
+
+    # Memory hits never touch Redis, so counters are pushed in batches
+    if event != "memory_hits" or sum(stats.values()) >= STATS_FLUSH_INTERVAL:
+        _flush_stats()
+
+
+def _flush_stats():
+    stats = _pending_stats.pop(frappe.local.site, None)
+    if not stats:
+        return
+
+    cache = frappe.cache()
+    key = cache.make_key(POST_OFFICE_STATS_KEY)
+    pipeline = cache.pipeline()
+    for event, count in stats.items():
+        pipeline.hincrby(key, event, count)
+    pipeline.execute()
+
+
+@frappe.whitelist()
+def get_pincode_cache_stats():
+    """Hit and miss counters of the pincode cache, summed over all workers."""
+    _flush_stats()
+
+    # Counters are plain integers, so bypass the wrapper's unpickling hgetall
+    cache = frappe.cache()
+    raw = cache.pipeline().hgetall(cache.make_key(POST_OFFICE_STATS_KEY)).execute()[0] or {}
+    stats = {frappe.safe_decode(event): int(count) for event, count in raw.items()}
+    lookups = stats.get("memory_hits", 0) + stats.get("redis_hits", 0) + stats.get("misses", 0)
+    stats["hit_ratio"] = round(1 - stats.get("misses", 0) / lookups, 4) if lookups else 0
+
+    return stats
+
+
+def resolve_post_offices(pincode):
+    """Read a pincode from the local directory, fetching and storing it if missing."""
+    offices = get_post_offices(pincode)
+    if offices or not can_fetch_remote():
+        return offices
+
+    offices = fetch_post_offices_remote(pincode)
+    if offices:
+        save_post_offices(pincode, offices)
+    return offices
+
+
+def can_fetch_remote():
+    # Imports, migrations and patches must never wait on the network
+    if frappe.flags.in_import or frappe.flags.in_migrate or frappe.flags.in_patch:
+        return False
+
+    return bool(frappe.get_cached_doc("Settings for Automation").fetch_missing_pincodes)
+
+
+def fetch_post_offices_remote(pincode):
     url = f"https://api.postalpincode.in/pincode/{pincode}"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64;x64)"
@@ -38,10 +301,35 @@ def get_post_offices_api(pincode):
 
 
 
+TAX_CATEGORY_RULES_KEY = "address_tax_category_rules"
+
+
 def validate_address(doc, method):
-    matched = False
-    country_matched = False
+    doc.tax_category = get_tax_category(doc.country, doc.state)
+    doc.custom_automate = 0
+
+
+@frappe.whitelist()
+def get_tax_category(country, state=None):
+    """In-State, Out-State or Overseas for a country and state, per Automate Default Values.
+
+    In-State when a Party Default Values row has this country and state,
+    Out-State when a row only shares the country, Overseas otherwise.
+    """
+    rules = frappe.cache().get_value(TAX_CATEGORY_RULES_KEY, _build_tax_category_rules)
 
+    if (country, state) in rules["states"]:
+        return "In-State"
+    if country in rules["countries"]:
+        return "Out-State"
+    return "Overseas"
+
+
+def clear_tax_category_rules():
+    frappe.cache().delete_value(TAX_CATEGORY_RULES_KEY)
+
+
+def _build_tax_category_rules():
     # Get all child table rows from Automate Default Values
     child_rows = frappe.get_all(
         "Party Default Values",
@@ -49,22 +337,10 @@ def validate_address(doc, method):
         filters={"parenttype": "Automate Default Values"}
     )
 
-    for row in child_rows:
-        if row.country == doc.country:
-            if row.state and row.state == doc.state:
-                doc.tax_category = "In-State"
-                matched = True
-                break
-            else:
-                country_matched = True
-
-    if not matched:
-        if country_matched:
-            doc.tax_category = "Out-State"
-        else:
-            doc.tax_category = "Overseas"
-    
-    doc.custom_automate = 0
+    return {
+        "countries": {row.country for row in child_rows},
+        "states": {(row.country, row.state) for row in child_rows if row.state},
+    }
 
 
 
@@ -3,13 +3,19 @@ import frappe
 @frappe.whitelist()
 def update_customer_territory_from_address(doc, method):
     linked_customers = [link.link_name for link in doc.links if link.link_doctype == "Customer"]
-    linked_suppliers = [link.link_name for link in doc.links if link.link_doctype == "Supplier"]
 
     # Update customer territory
-    for customer_name in linked_customers:
-        customer = frappe.get_doc("Customer", customer_name)
-        customer.territory = doc.custom_post_office
-        customer.save(ignore_permissions=True)
+    propagate_territory_to_customers(doc, linked_customers)
+
+
+def set_address_title(doc, method=None):
+    """Title the address after its first linked Customer (or Supplier) and city.
+
+    Runs in validate so the title is written with the rest of the document,
+    instead of re-saving the Address (and re-running every hook) from on_update.
+    """
+    linked_customers = [link.link_name for link in doc.links if link.link_doctype == "Customer"]
+    linked_suppliers = [link.link_name for link in doc.links if link.link_doctype == "Supplier"]
 
     # Prepare address_title
     name = None
@@ -23,7 +29,24 @@ def update_customer_territory_from_address(doc, method):
         if doc.city:
             title += f", {doc.city}"
 
-        if doc.address_title != title:
-            doc.address_title = title
-            doc.flags.ignore_validate_update_after_submit = True
-            doc.save(ignore_permissions=True)
+        doc.address_title = title
+
+
+def propagate_territory_to_customers(doc, customer_names):
+    """Point linked customers at the address territory, writing only those that differ.
+
+    Uses a single UPDATE instead of saving each Customer, so none of the
+    Customer hooks run just to copy a territory across.
+    """
+    territory = doc.get("territory") or doc.custom_post_office
+    if not territory or not customer_names:
+        return
+
+    stale_customers = frappe.get_all(
+        "Customer",
+        filters={"name": ["in", customer_names], "territory": ["!=", territory]},
+        pluck="name"
+    )
+
+    if stale_customers:
+        frappe.db.set_value("Customer", {"name": ["in", stale_customers]}, "territory", territory)
@@ -0,0 +1,136 @@
+import re
+
+import frappe
+from frappe.utils import cstr
+
+from validation.customization.utils import write_column
+
+# Dropped before comparing, so "M/s. Acme Traders Pvt Ltd" and "acme traders" share a key
+NOISE_TOKENS = frozenset({"ms", "mr", "mrs", "dr", "the", "pvt", "private", "ltd", "limited", "llp"})
+PUNCTUATION = re.compile(r"[^\w\s]")
+NON_DIGITS = re.compile(r"\D")
+
+KEY_FIELD = "custom_normalized_name"
+KEY_LENGTH = 140
+
+# {doctype: field the normalized key is built from}
+PARTY_NAME_FIELDS = {
+    "Customer": "customer_name",
+    "Supplier": "supplier_name",
+    "Contact": "full_name",
+}
+
+# {doctype: mobile field find_similar_parties matches on}; custom_mobile is a
+# site Custom Field, so DocTypes without the field are left out
+PARTY_MOBILE_FIELDS = {
+    "Contact": "mobile_no",
+    "Customer": "custom_mobile",
+}
+
+MAX_MATCHES = 20
+CHUNK_SIZE = 5000
+
+
+def get_name_key(name):
+    """Casefold, strip punctuation and sort the tokens of `name`, ignoring honorifics and legal suffixes."""
+    tokens = PUNCTUATION.sub("", cstr(name).casefold()).split()
+    significant = [token for token in tokens if token not in NOISE_TOKENS]
+    return " ".join(sorted(significant or tokens))[:KEY_LENGTH]
+
+
+def get_mobile_variants(mobile):
+    """The ways the last ten digits of `mobile` are commonly stored, for an indexed IN lookup."""
+    digits = NON_DIGITS.sub("", cstr(mobile))
+    if len(digits) < 10:
+        return []
+
+    local = digits[-10:]
+    return list(dict.fromkeys([cstr(mobile).strip(), digits, local, "0" + local, "+91" + local, "+91 " + local, "+91-" + local]))
+
+
+def get_party_title(doc):
+    title = doc.get(PARTY_NAME_FIELDS[doc.doctype])
+    if not title and doc.doctype == "Contact":
+        title = " ".join(filter(None, [doc.get("first_name"), doc.get("middle_name"), doc.get("last_name")]))
+    return title
+
+
+def set_normalized_name(doc, method=None):
+    """Before-save hook keeping the indexed duplicate-detection key in step with the party name.
+
+    Runs after every validate hook, including the "*" Private Dictionary
+    correction, so the key is built from the title that is actually saved.
+    """
+    doc.set(KEY_FIELD, get_name_key(get_party_title(doc)) or None)
+
+
+@frappe.whitelist()
+def find_similar_parties(name=None, mobile=None, exclude=None):
+    """Return Customers, Suppliers and Contacts that look like duplicates of `name` or `mobile`.
+
+    Answered by one UNION query whose branches are each an equality lookup on
+    an indexed column, so the cost does not grow with the number of parties.
+    """
+    key = get_name_key(name) if name else None
+    mobiles = get_mobile_variants(mobile) if mobile else []
+    values = {"key": key, "mobiles": tuple(mobiles), "exclude": exclude or ""}
+    branches = []
+
+    for doctype, title_field in PARTY_NAME_FIELDS.items():
+        if not frappe.has_permission(doctype, "read"):
+            continue
+
+        if key:
+            branches.append(
+                f"""(select '{doctype}' as doctype, name, `{title_field}` as title, 'Name' as matched_on
+                from `tab{doctype}` where `{KEY_FIELD}` = %(key)s and name != %(exclude)s limit {MAX_MATCHES})"""
+            )
+        mobile_field = PARTY_MOBILE_FIELDS.get(doctype)
+        if mobiles and mobile_field and frappe.get_meta(doctype).has_field(mobile_field):
+            branches.append(
+                f"""(select '{doctype}' as doctype, name, `{title_field}` as title, 'Mobile' as matched_on
+                from `tab{doctype}` where `{mobile_field}` in %(mobiles)s and name != %(exclude)s limit {MAX_MATCHES})"""
+            )
+
+    if not branches:
+        return []
+
+    matches = frappe.db.sql(" union all ".join(branches), values, as_dict=True)
+    # User permissions can hide single records of a readable DocType
+    return [match for match in matches if frappe.has_permission(match.doctype, "read", match.name)]
+
+
+def backfill_normalized_names(doctype, chunk_size=CHUNK_SIZE):
+    """Fill the normalized key of every existing `doctype` record in keyset-ordered chunks."""
+    title_field = PARTY_NAME_FIELDS[doctype]
+    extra_fields = ", first_name, middle_name, last_name" if doctype == "Contact" else ""
+    last_name = ""
+
+    while True:
+        rows = frappe.db.sql(
+            f"""select name, `{title_field}`, `{KEY_FIELD}`{extra_fields} from `tab{doctype}`
+            where name > %s order by name limit %s""",
+            (last_name, chunk_size),
+            as_dict=True,
+        )
+        if not rows:
+            break
+
+        keys = {}
+        for row in rows:
+            row.doctype = doctype
+            key = get_name_key(get_party_title(row)) or None
+            if key != row.get(KEY_FIELD):
+                keys[row.name] = key
+
+        if keys:
+            write_column(doctype, KEY_FIELD, keys)
+        frappe.db.commit()
+        last_name = rows[-1].name
+
+
+def add_party_indexes():
+    """After-migrate hook adding the mobile indexes find_similar_parties relies on besides the key fields."""
+    for doctype, fieldname in PARTY_MOBILE_FIELDS.items():
+        if frappe.get_meta(doctype).has_field(fieldname):
+            frappe.db.add_index(doctype, [fieldname])
@@ -6,12 +6,18 @@ from frappe.utils import flt
 def validate_packed_items_stock(doc, method):
     """
     Validate stock availability for items in packed_items child table before submit
+
+    Stock already reserved by other orders is not available, and the Bin rows
+    stay locked until this submit commits so parallel submits cannot oversell.
     """
     if not doc.packed_items:
         return
     
-    insufficient_items = []
-    
+    # Sum demand per (item, warehouse) so a component shared by several
+    # bundles is checked against its combined quantity
+    required = {}
+    item_names = {}
+
     for item in doc.packed_items:
         if not item.item_code:
             continue
@@ -21,19 +27,26 @@ def validate_packed_items_stock(doc, method):
         
         if not warehouse:
             frappe.throw(_("Warehouse not set for item {0} in packed items").format(item.item_code))
-        
-        # Get available stock
-        available_qty = frappe.db.get_value("Bin", 
-            {"item_code": item.item_code, "warehouse": warehouse}, 
-            "actual_qty") or 0
-        
-        required_qty = flt(item.qty)
-        
+
+        key = (item.item_code, warehouse)
+        required[key] = required.get(key, 0) + flt(item.qty)
+        item_names.setdefault(key, item.item_name or item.item_code)
+
+    if not required:
+        return
+
+    available = get_available_qty(required.keys())
+
+    insufficient_items = []
+
+    for (item_code, warehouse), required_qty in required.items():
+        available_qty = available.get((item_code, warehouse), 0)
+
         # Check if stock is insufficient
         if available_qty < required_qty:
             insufficient_items.append({
-                "item_code": item.item_code,
-                "item_name": item.item_name or item.item_code,
+                "item_code": item_code,
+                "item_name": item_names[(item_code, warehouse)],
                 "required": required_qty,
                 "available": available_qty,
                 "warehouse": warehouse
@@ -54,4 +67,27 @@ def validate_packed_items_stock(doc, method):
                 item["available"]
             )
         
-        frappe.throw(error_msg, title=_("Insufficient Stock"))
\ No newline at end of file
+        frappe.throw(error_msg, title=_("Insufficient Stock"))
+
+
+def get_available_qty(pairs):
+    """Lock the Bins of many (item_code, warehouse) pairs and return their unreserved qty.
+
+    Rows are locked in (item_code, warehouse) order, the order of Bin's unique
+    index, so concurrent submits always queue on the same first row instead
+    of deadlocking on each other.
+    """
+    pairs = sorted(pairs)
+    conditions = " or ".join(["(item_code = %s and warehouse = %s)"] * len(pairs))
+    values = [value for pair in pairs for value in pair]
+
+    bins = frappe.db.sql(f"""
+        select item_code, warehouse, actual_qty,
+            reserved_qty + reserved_qty_for_production + reserved_qty_for_sub_contract as reserved_qty
+        from `tabBin`
+        where {conditions}
+        order by item_code, warehouse
+        for update
+    """, values, as_dict=1)
+
+    return {(b.item_code, b.warehouse): flt(b.actual_qty) - flt(b.reserved_qty) for b in bins}
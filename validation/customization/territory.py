@@ -2,54 +2,150 @@
 
 import frappe
 from frappe.model.document import Document
+from frappe.utils import now
+
+ROOT_TERRITORY = "All Territories"
+TERRITORY_CHAIN_CACHE_KEY = "address_territory_chains"
+
 
 @frappe.whitelist()
 def ensure_territory_from_address(doc, method):
-    # your territory creation code ...
-    territory_chain = ["India"]
-    if doc.state:
-        territory_chain.append(doc.state.strip())
-    if doc.county:
-        territory_chain.append(doc.county.strip())
-    if doc.custom_taluk:
-        territory_chain.append(doc.custom_taluk.strip())
-    if doc.custom_post_office:
-        territory_chain.append(doc.custom_post_office.strip())
+    territory_chain = get_territory_chain(doc)
 
     if len(territory_chain) < 2:
         frappe.throw("At least State and Post Office must be set to generate Territory.")
 
-    parent = "All Territories"
-    for territory in territory_chain:
-        existing = frappe.db.exists("Territory", territory)
-        if not existing:
-            new_territory = frappe.get_doc({
-                "doctype": "Territory",
-                "territory_name": territory,
-                "parent_territory": parent,
-                "is_group": 1
-            })
-            if territory == territory_chain[-1]:
-                new_territory.is_group = 0
-            new_territory.save(ignore_permissions=True)
-            parent = new_territory.name
-        else:
-            parent = territory
+    ensure_territory_chains([territory_chain])
 
     doc.territory = territory_chain[-1]
+    # Linked customers are updated once, on_update, by propagate_territory_to_customers
+
+
+def get_territory_chain(doc):
+    """India -> State -> County -> Taluk -> Post Office, skipping empty levels."""
+    territory_chain = ["India"]
+    for fieldname in ("state", "county", "custom_taluk", "custom_post_office"):
+        if doc.get(fieldname):
+            territory_chain.append(doc.get(fieldname).strip())
+    return territory_chain
+
+
+def ensure_territory_chains(chains):
+    """Make sure every territory of every chain exists, creating the missing ones in bulk.
+
+    Chains already known to exist are remembered in Redis, so repeated saves of
+    addresses in the same post office cost no queries at all.
+    """
+    cache = frappe.cache()
+    pending = [chain for chain in chains if not cache.hget(TERRITORY_CHAIN_CACHE_KEY, _chain_key(chain))]
+    if not pending:
+        return
+
+    names = {territory for chain in pending for territory in chain}
+    if len(_get_existing_territories(names)) < len({name.lower() for name in names}):
+        # Re-read under lock: a snapshot read can miss a territory another worker just inserted
+        _create_missing_territories(pending, _get_existing_territories(names, for_update=True))
+        # Remember created chains only once they are visible to other workers
+        frappe.db.after_commit.add(lambda: _remember_chains(pending))
+    else:
+        _remember_chains(pending)
+
+
+def clear_territory_cache(doc=None, method=None, *args, **kwargs):
+    """Doc event for Territory on_trash and after_rename."""
+    frappe.cache().delete_value(TERRITORY_CHAIN_CACHE_KEY)
+
+
+def _chain_key(chain):
+    return "/".join(territory.lower() for territory in chain)
+
+
+def _remember_chains(chains):
+    for chain in chains:
+        frappe.cache().hset(TERRITORY_CHAIN_CACHE_KEY, _chain_key(chain), 1)
 
-    linked_customers = frappe.get_all(
-        "Dynamic Link",
-        filters={
-            "link_doctype": "Customer",
-            "parenttype": "Address",
-            "parent": doc.name
-        },
-        fields=["link_name"]
+
+def _get_existing_territories(names, for_update=False):
+    """Map lowercased names to their stored spelling, in a single query.
+
+    With `for_update` the rows are read current and locked (absent names get a gap
+    lock), so concurrent saves cannot create the same territory twice.
+    """
+    rows = frappe.get_all(
+        "Territory",
+        filters={"name": ["in", list(names)]},
+        fields=["name", "is_group"],
+        for_update=for_update
     )
+    return {row.name.lower(): row for row in rows}
+
+
+def _create_missing_territories(chains, existing):
+    new_nodes = {}
+    children = {}
+    parents_to_group = set()
+
+    for chain in chains:
+        parent = ROOT_TERRITORY
+        for idx, territory in enumerate(chain):
+            is_leaf = idx == len(chain) - 1
+            key = territory.lower()
+
+            if key in existing:
+                if not is_leaf and not existing[key].is_group:
+                    parents_to_group.add(existing[key].name)
+                parent = existing[key].name
+                continue
+
+            node = new_nodes.get(key)
+            if not node:
+                node = new_nodes[key] = frappe._dict(name=territory, parent=parent, is_group=0 if is_leaf else 1)
+                children.setdefault(parent, []).append(node)
+            elif not is_leaf:
+                node.is_group = 1
+            parent = node.name
+
+    for name in parents_to_group:
+        frappe.db.set_value("Territory", name, "is_group", 1, update_modified=False)
 
-    for link in linked_customers:
-        customer = frappe.get_doc("Customer", link.link_name)
-        customer.territory = doc.territory
-        customer.save(ignore_permissions=True)
-     
+    for parent in sorted(name for name in children if name.lower() not in new_nodes):
+        _insert_subtree(parent, children)
+
+
+def _insert_subtree(parent, children):
+    """Insert all new descendants of an existing territory with one lft/rgt shift."""
+    # Locking read, as in frappe.utils.nestedset: the shift must start from the current rgt
+    parent_rgt = frappe.db.get_value("Territory", parent, "rgt", for_update=True)
+
+    nodes = []
+    counter = parent_rgt
+
+    def assign(node):
+        nonlocal counter
+        node.lft = counter
+        counter += 1
+        for child in children.get(node.name, []):
+            assign(child)
+        node.rgt = counter
+        counter += 1
+        nodes.append(node)
+
+    for child in children[parent]:
+        assign(child)
+
+    width = counter - parent_rgt
+    frappe.db.sql("update `tabTerritory` set lft = lft + %s where lft > %s", (width, parent_rgt))
+    frappe.db.sql("update `tabTerritory` set rgt = rgt + %s where rgt >= %s", (width, parent_rgt))
+
+    timestamp = now()
+    user = frappe.session.user
+    frappe.db.bulk_insert(
+        "Territory",
+        fields=["name", "territory_name", "parent_territory", "old_parent", "is_group", "lft", "rgt",
+            "creation", "modified", "owner", "modified_by"],
+        values=[
+            (node.name, node.name, node.parent, node.parent, node.is_group, node.lft, node.rgt,
+                timestamp, timestamp, user, user)
+            for node in nodes
+        ]
+    )
@@ -0,0 +1,68 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import time
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization import address
+from validation.customization.address import TTLCache, get_enrichment_values
+
+
+class TestPincodeCache(FrappeTestCase):
+	def test_ttl_cache_evicts_least_recently_used(self):
+		cache = TTLCache()
+		cache.set("a", [1], ttl=60, maxsize=2)
+		cache.set("b", [2], ttl=60, maxsize=2)
+		cache.get("a")
+		cache.set("c", [3], ttl=60, maxsize=2)
+
+		self.assertEqual(cache.get("a"), [1])
+		self.assertIs(cache.get("b"), TTLCache.MISSING)
+		self.assertEqual(cache.get("c"), [3])
+
+	def test_ttl_cache_keeps_negative_entries_until_expiry(self):
+		cache = TTLCache()
+		cache.set("unknown", [], ttl=0.01, maxsize=10)
+
+		self.assertEqual(cache.get("unknown"), [])
+		time.sleep(0.02)
+		self.assertIs(cache.get("unknown"), TTLCache.MISSING)
+
+	def test_lookup_returns_copies_of_cached_offices(self):
+		pincode = "_T682030"
+		address.clear_post_office_cache(pincode)
+		offices = [frappe._dict(post_office="Kakkanad", taluk="Kanayannur")]
+
+		with patch.object(address, "resolve_post_offices", return_value=offices):
+			address.lookup_post_offices(pincode)[0].post_office = "Changed"
+
+			self.assertEqual(address.lookup_post_offices(pincode)[0].post_office, "Kakkanad")
+
+	def test_unknown_pincode_is_not_cached_without_remote_fetch(self):
+		pincode = "_T000000"
+		address.clear_post_office_cache(pincode)
+
+		with patch.object(address, "resolve_post_offices", return_value=[]), patch.object(
+			address, "can_fetch_remote", return_value=False
+		):
+			address.lookup_post_offices(pincode)
+
+		self.assertIsNone(frappe.cache().get_value(f"{address.POST_OFFICE_CACHE_KEY}:{pincode}"))
+
+
+class TestAddressEnrichment(FrappeTestCase):
+	def test_single_office_fills_both_fields(self):
+		values = get_enrichment_values([{"post_office": "Kakkanad", "taluk": "Kanayannur"}])
+
+		self.assertEqual(values, {"custom_post_office": "Kakkanad", "custom_taluk": "Kanayannur"})
+
+	def test_ambiguous_offices_only_fill_shared_taluk(self):
+		values = get_enrichment_values([
+			{"post_office": "Kakkanad", "taluk": "Kanayannur"},
+			{"post_office": "Thrikkakara", "taluk": "Kanayannur"},
+		])
+
+		self.assertEqual(values, {"custom_taluk": "Kanayannur"})
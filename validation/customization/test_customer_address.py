@@ -0,0 +1,65 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization import address, customer_address, territory
+
+# Regression guard for a plain re-save of a linked Address. The recursive
+# save from on_update used to run every hook, and roughly double this, twice.
+ADDRESS_SAVE_QUERY_BUDGET = 80
+
+
+class TestAddressSave(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		if not frappe.db.exists("Customer", "_Test Address Customer"):
+			frappe.get_doc({
+				"doctype": "Customer",
+				"customer_name": "_Test Address Customer",
+				"customer_type": "Company",
+			}).insert(ignore_mandatory=True)
+
+	def make_address(self):
+		return frappe.get_doc({
+			"doctype": "Address",
+			"address_line1": "1 Test Road",
+			"city": "Kochi",
+			"state": "Kerala",
+			"country": "India",
+			"custom_post_office": "_Test Address PO",
+			"links": [{"link_doctype": "Customer", "link_name": "_Test Address Customer"}],
+		})
+
+	def test_address_hooks_run_once_per_save(self):
+		hooks = {
+			"territory": patch.object(territory, "ensure_territory_from_address", wraps=territory.ensure_territory_from_address),
+			"tax_category": patch.object(address, "validate_address", wraps=address.validate_address),
+			"title": patch.object(customer_address, "set_address_title", wraps=customer_address.set_address_title),
+			"on_update": patch.object(
+				customer_address,
+				"update_customer_territory_from_address",
+				wraps=customer_address.update_customer_territory_from_address,
+			),
+		}
+		mocks = {key: hook.start() for key, hook in hooks.items()}
+		self.addCleanup(patch.stopall)
+
+		doc = self.make_address().insert()
+
+		for key, mock in mocks.items():
+			self.assertEqual(mock.call_count, 1, f"{key} hook ran {mock.call_count} times")
+
+		self.assertEqual(doc.address_title, "_Test Address Customer, Kochi")
+		self.assertEqual(frappe.db.get_value("Customer", "_Test Address Customer", "territory"), "_Test Address PO")
+
+	def test_address_resave_query_budget(self):
+		doc = self.make_address().insert()
+		doc.address_line2 = "Near Test Junction"
+
+		with self.assertQueryCount(ADDRESS_SAVE_QUERY_BUDGET):
+			doc.save()
@@ -0,0 +1,37 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization.party_dedupe import find_similar_parties, get_mobile_variants, get_name_key
+
+
+class TestPartyDedupe(FrappeTestCase):
+	def test_name_key_ignores_case_punctuation_order_and_suffixes(self):
+		key = get_name_key("Acme Traders")
+
+		self.assertEqual(get_name_key("M/s. TRADERS,  acme Pvt. Ltd."), key)
+		self.assertEqual(key, "acme traders")
+
+	def test_name_key_keeps_names_made_only_of_noise_words(self):
+		self.assertEqual(get_name_key("The Private Limited"), "limited private the")
+
+	def test_mobile_variants_cover_common_formats(self):
+		variants = get_mobile_variants("+91 98470 12345")
+
+		self.assertIn("9847012345", variants)
+		self.assertIn("+919847012345", variants)
+		self.assertEqual(get_mobile_variants("12345"), [])
+
+	def test_find_similar_parties_matches_normalized_name(self):
+		customer = frappe.get_doc({
+			"doctype": "Customer",
+			"customer_name": "_Test Dedupe Spices",
+			"customer_type": "Company",
+		}).insert(ignore_mandatory=True)
+
+		matches = find_similar_parties("test dedupe SPICES")
+
+		self.assertIn(("Customer", customer.name), [(match.doctype, match.name) for match in matches])
+		self.assertFalse(find_similar_parties("test dedupe spices", exclude=customer.name))
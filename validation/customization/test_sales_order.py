@@ -0,0 +1,78 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import os
+import threading
+import unittest
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+CONCURRENT_SUBMITS = 8
+STOCK_QTY = 10
+ORDER_QTY = 3
+
+
+@unittest.skipUnless(
+	os.environ.get("VALIDATION_LOAD_TEST"),
+	"Commits to the site database; set VALIDATION_LOAD_TEST=1 to run against a local MariaDB"
+)
+class TestConcurrentPackedItemSubmit(FrappeTestCase):
+	"""Submits bundle Sales Orders from parallel connections against one component Bin."""
+
+	def setUp(self):
+		from erpnext.selling.doctype.product_bundle.test_product_bundle import make_product_bundle
+		from erpnext.stock.doctype.item.test_item import make_item
+		from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+
+		suffix = frappe.generate_hash(length=6)
+		self.component = make_item(f"_Test Load Component {suffix}", {"is_stock_item": 1}).name
+		self.bundle = make_item(f"_Test Load Bundle {suffix}", {"is_stock_item": 0}).name
+		make_product_bundle(self.bundle, [self.component], qty=1)
+		make_stock_entry(item_code=self.component, target="_Test Warehouse - _TC", qty=STOCK_QTY, basic_rate=100)
+		# Worker connections only see committed data
+		frappe.db.commit()
+
+	def test_parallel_submits_never_oversell(self):
+		barrier = threading.Barrier(CONCURRENT_SUBMITS)
+		results = []
+		threads = [
+			threading.Thread(target=self.submit_order, args=(frappe.local.site, barrier, results))
+			for _ in range(CONCURRENT_SUBMITS)
+		]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertNotIn("error", results)
+		self.assertEqual(results.count("submitted"), STOCK_QTY // ORDER_QTY)
+
+		reserved = frappe.db.get_value(
+			"Bin", {"item_code": self.component, "warehouse": "_Test Warehouse - _TC"}, "reserved_qty"
+		)
+		self.assertLessEqual(reserved, STOCK_QTY)
+
+	def submit_order(self, site, barrier, results):
+		from erpnext.selling.doctype.sales_order.test_sales_order import make_sales_order
+
+		frappe.init(site=site)
+		frappe.connect()
+		frappe.set_user("Administrator")
+		try:
+			order = make_sales_order(
+				item_code=self.bundle, qty=ORDER_QTY, warehouse="_Test Warehouse - _TC", do_not_submit=True
+			)
+			frappe.db.commit()
+			barrier.wait()
+			order.submit()
+			frappe.db.commit()
+			results.append("submitted")
+		except frappe.ValidationError:
+			frappe.db.rollback()
+			results.append("rejected")
+		except Exception:
+			frappe.db.rollback()
+			results.append("error")
+		finally:
+			frappe.destroy()
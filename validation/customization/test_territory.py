@@ -0,0 +1,28 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization.territory import ensure_territory_chains
+
+
+class TestTerritoryChain(FrappeTestCase):
+	def test_bulk_creation_keeps_nested_set_consistent(self):
+		base = ["India", "_Test State", "_Test District", "_Test Taluk"]
+		ensure_territory_chains([base + ["_Test PO 1"], base + ["_Test PO 2"]])
+
+		taluk = frappe.db.get_value("Territory", "_Test Taluk", ["lft", "rgt", "is_group"], as_dict=True)
+		post_office = frappe.db.get_value("Territory", "_Test PO 2", ["lft", "rgt", "is_group", "parent_territory"], as_dict=True)
+
+		self.assertTrue(taluk.is_group)
+		self.assertFalse(post_office.is_group)
+		self.assertEqual(post_office.parent_territory, "_Test Taluk")
+		self.assertTrue(taluk.lft < post_office.lft < post_office.rgt < taluk.rgt)
+
+		ancestors = frappe.get_all(
+			"Territory",
+			filters={"lft": ["<", post_office.lft], "rgt": [">", post_office.rgt]},
+			pluck="name"
+		)
+		self.assertEqual(set(ancestors), {"All Territories", "India", "_Test State", "_Test District", "_Test Taluk"})
@@ -0,0 +1,43 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization import text_formatter
+from validation.customization.text_formatter import FIELD_RULES, normalize_values
+
+
+class TestTextFormatter(FrappeTestCase):
+	def test_customer_name_matches_form_script(self):
+		rule = text_formatter.CUSTOMER_NAME
+
+		self.assertEqual(rule.format("  the acme   traders, GST 2 "), "the Acme Traders GST 2")
+		self.assertEqual(rule.format("o'brien & sons"), "Obrien Sons")
+
+	def test_supplier_keeps_first_small_word_capitalized(self):
+		self.assertEqual(text_formatter.SUPPLIER_TEXT.format("the india spice co"), "The India Spice Co")
+
+	def test_item_name_recases_capitals(self):
+		rule = text_formatter.ITEM_NAME_TEXT
+
+		self.assertEqual(rule.format("RED chilli_powder - of 1KG!"), "Red Chilli_powder - of 1kg")
+
+	def test_item_description_drops_markup(self):
+		rule = text_formatter.ITEM_DESCRIPTION
+
+		self.assertEqual(rule.format("<p>red chilli <b>PACK</b></p>"), "Red Chilli PACK")
+
+	def test_values_made_only_of_stripped_characters_are_kept(self):
+		rules = FIELD_RULES["Customer"][1]
+		rules = {fieldname: rule for fieldname, (rule, _) in rules.items()}
+
+		self.assertEqual(normalize_values("Customer", {"customer_name": "&&&"}, rules), {})
+
+	def test_contact_full_name_follows_name_parts(self):
+		rules = {fieldname: rule for fieldname, (rule, _) in FIELD_RULES["Contact"][1].items()}
+		row = {"first_name": "jOHN", "last_name": "o'neil", "full_name": "jOHN o'neil"}
+
+		self.assertEqual(
+			normalize_values("Contact", row, rules),
+			{"first_name": "John", "last_name": "Oneil", "full_name": "John Oneil"},
+		)
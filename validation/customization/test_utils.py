@@ -0,0 +1,24 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.customization.utils import write_column
+
+
+class TestUtils(FrappeTestCase):
+	def test_write_column_updates_each_row(self):
+		names = []
+		for customer_name in ("_Test Normalize One", "_Test Normalize Two"):
+			doc = frappe.get_doc({
+				"doctype": "Customer",
+				"customer_name": customer_name,
+				"customer_type": "Company",
+			}).insert(ignore_mandatory=True)
+			names.append(doc.name)
+
+		write_column("Customer", "customer_details", {names[0]: "First", names[1]: "Second"})
+
+		self.assertEqual(frappe.db.get_value("Customer", names[0], "customer_details"), "First")
+		self.assertEqual(frappe.db.get_value("Customer", names[1], "customer_details"), "Second")
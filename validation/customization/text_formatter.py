@@ -0,0 +1,267 @@
+import re
+import time
+
+import frappe
+from frappe import _
+from frappe.utils import cint, strip_html_tags
+
+from validation.customization.utils import write_column
+from validation.validation.doctype.private_dictionary.private_dictionary import (
+    apply_private_dictionary,
+    get_dictionary_matcher,
+    get_replacement_plan,
+)
+
+# Same word list as TextFormatter.lowercaseWords in the form scripts
+LOWERCASE_WORDS = frozenset({
+    "a", "an", "the", "and", "but", "or", "for", "nor",
+    "on", "at", "to", "from", "by", "in", "of", "with",
+})
+
+WHITESPACE = re.compile(r"\s+")
+
+# Characters each form script keeps; everything else is stripped
+LETTERS = re.compile(r"[^a-zA-Z\s]")
+LETTERS_AND_DIGITS = re.compile(r"[^a-zA-Z0-9\s]")
+ITEM_TEXT = re.compile(r"[^a-zA-Z0-9\s\-]")
+ITEM_NAME = re.compile(r"[^a-zA-Z0-9\s\-_]")
+
+CHUNK_SIZE = 5000
+RENORMALIZE_JOB_TIMEOUT = 60 * 60
+
+
+class TextRule:
+    """One flavour of TextFormatter.full from the form scripts.
+
+    `keep_uppercase` leaves words typed in capitals (GST, LLP) untouched and
+    `capitalize_first` exempts the first word from the small-word list.
+    """
+
+    __slots__ = ("strip", "keep_uppercase", "capitalize_first", "html")
+
+    def __init__(self, strip, keep_uppercase=True, capitalize_first=False, html=False):
+        self.strip = strip
+        self.keep_uppercase = keep_uppercase
+        self.capitalize_first = capitalize_first
+        self.html = html
+
+    def format(self, text):
+        if not text:
+            return text
+
+        if self.html:
+            text = strip_html_tags(text)
+
+        words = WHITESPACE.split(self.strip.sub("", text).strip())
+        return " ".join(self._format_word(word, index) for index, word in enumerate(words) if word)
+
+    def _format_word(self, word, index):
+        if self.keep_uppercase and word == word.upper():
+            return word
+
+        lower = word.lower()
+        if lower in LOWERCASE_WORDS and not (self.capitalize_first and index == 0):
+            return lower
+        return lower[:1].upper() + lower[1:]
+
+
+# customer_name.js
+CUSTOMER_NAME = TextRule(LETTERS_AND_DIGITS)
+CUSTOMER_TEXT = TextRule(LETTERS)
+# supplier_name.js
+SUPPLIER_TEXT = TextRule(LETTERS, capitalize_first=True)
+# item_name.js
+ITEM_NAME_TEXT = TextRule(ITEM_NAME, keep_uppercase=False, capitalize_first=True)
+ITEM_DESCRIPTION = TextRule(ITEM_TEXT, html=True)
+# contact_name.js
+CONTACT_NAME = TextRule(LETTERS)
+
+# {doctype: (settings field, {fieldname: (rule, per-field settings field)})}
+# Item codes are left alone: they are the document name, so rewriting them
+# server side would silently rename the Item.
+FIELD_RULES = {
+    "Customer": ("enable_customer_automation", {
+        "customer_name": (CUSTOMER_NAME, None),
+        "customer_details": (CUSTOMER_TEXT, None),
+    }),
+    "Supplier": ("enable_supplier_automation", {
+        "supplier_name": (SUPPLIER_TEXT, None),
+        "supplier_details": (SUPPLIER_TEXT, None),
+    }),
+    "Item": ("enable_item_automation", {
+        "item_name": (ITEM_NAME_TEXT, "item_name_automation"),
+        "description": (ITEM_DESCRIPTION, "description_automation"),
+    }),
+    "Contact": ("enable_contact_automation", {
+        "first_name": (CONTACT_NAME, None),
+        "middle_name": (CONTACT_NAME, None),
+        "last_name": (CONTACT_NAME, None),
+    }),
+}
+
+CONTACT_NAME_FIELDS = ("first_name", "middle_name", "last_name")
+
+
+def get_enabled_rules(doctype):
+    """Return {fieldname: rule} for the fields of `doctype` switched on in Settings for Automation."""
+    if doctype not in FIELD_RULES:
+        return {}
+
+    settings = frappe.get_cached_doc("Settings for Automation")
+    enable_field, field_rules = FIELD_RULES[doctype]
+    if not cint(settings.get(enable_field)):
+        return {}
+
+    return {
+        fieldname: rule
+        for fieldname, (rule, setting) in field_rules.items()
+        if not setting or cint(settings.get(setting))
+    }
+
+
+def normalize_values(doctype, values, rules=None, matcher=None):
+    """Return the fields of `values` (a dict or document) whose normalized value differs.
+
+    Private Dictionary corrections are applied on top when `matcher` is given,
+    so the result is what saving the document would store.
+    """
+    rules = get_enabled_rules(doctype) if rules is None else rules
+    changes = {}
+
+    for fieldname, rule in rules.items():
+        value = values.get(fieldname)
+        if not value or not isinstance(value, str):
+            continue
+
+        formatted = rule.format(value)
+        if matcher and formatted:
+            formatted, _ = apply_private_dictionary(formatted, matcher)
+        # Never blank a value made only of stripped characters (e.g. non-Latin scripts)
+        if formatted and formatted != value:
+            changes[fieldname] = formatted
+
+    if doctype == "Contact" and changes:
+        names = [changes.get(fieldname, values.get(fieldname)) for fieldname in CONTACT_NAME_FIELDS]
+        # Same as update_full_name in contact_name.js
+        full_name = " ".join(name for name in names if name)
+        if full_name != values.get("full_name"):
+            changes["full_name"] = full_name
+
+    return changes
+
+
+def normalize_rows(doctype, rows, rules=None, matcher=None):
+    """Yield (row, changes) for every row of `rows` that normalization would change."""
+    rules = get_enabled_rules(doctype) if rules is None else rules
+    if not rules:
+        return
+
+    for row in rows:
+        changes = normalize_values(doctype, row, rules, matcher)
+        if changes:
+            yield row, changes
+
+
+def normalize_document(doc, method=None):
+    """Validate hook applying the form script formatting to records saved from anywhere.
+
+    New records are always formatted, so Data Import and REST API inserts match
+    the form. Also registered as a before_naming hook, as validate runs after
+    the name is set and records named by their title would keep the raw text
+    as their ID. Existing records are only reformatted when `custom_automate`
+    is set, which leaves names a user has deliberately corrected alone.
+    """
+    if not (doc.is_new() or doc.get("custom_automate")):
+        return
+
+    for fieldname, value in normalize_values(doc.doctype, doc).items():
+        doc.set(fieldname, value)
+
+
+@frappe.whitelist()
+def enqueue_renormalization(doctypes=None):
+    """Queue one background job per DocType to re-normalize existing records."""
+    frappe.only_for("System Manager")
+
+    doctypes = frappe.parse_json(doctypes) if doctypes else list(FIELD_RULES)
+    queued = []
+    for doctype in doctypes:
+        if doctype not in FIELD_RULES:
+            frappe.throw(_("Names of {0} records are not normalized.").format(doctype))
+        # A job with no enabled rule would not change anything
+        if not get_enabled_rules(doctype):
+            continue
+
+        frappe.enqueue(
+            "validation.customization.text_formatter.renormalize_doctype",
+            queue="long",
+            timeout=RENORMALIZE_JOB_TIMEOUT,
+            job_id=f"renormalize::{doctype}",
+            deduplicate=True,
+            enqueue_after_commit=True,
+            doctype=doctype,
+        )
+        queued.append(doctype)
+
+    return queued
+
+
+def renormalize_doctype(doctype, chunk_size=CHUNK_SIZE):
+    """Re-normalize every `doctype` record in keyset-ordered chunks.
+
+    Documents are never loaded: each chunk reads only the formatted columns,
+    writes them back with one CASE update per changed column and commits.
+    `modified` is not touched, as only formatting changes.
+    """
+    rules = get_enabled_rules(doctype)
+    stats = frappe._dict(scanned=0, updated=0, chunks=0, duration=0.0, rows_per_second=0)
+    if not rules:
+        return stats
+
+    columns = list(rules)
+    if doctype == "Contact":
+        columns = list(dict.fromkeys([*columns, *CONTACT_NAME_FIELDS, "full_name"]))
+
+    # Dictionary corrections run after formatting on save, so they must here too
+    matcher = get_dictionary_matcher() if get_replacement_plan(doctype) else None
+
+    logger = frappe.logger("normalization")
+    select_columns = ", ".join(f"`{column}`" for column in columns)
+    started = time.monotonic()
+    last_name = ""
+
+    while True:
+        chunk_started = time.monotonic()
+        rows = frappe.db.sql(
+            f"""select name, {select_columns} from `tab{doctype}`
+            where name > %s order by name limit %s""",
+            (last_name, chunk_size),
+            as_dict=True,
+        )
+        if not rows:
+            break
+
+        updates = {}
+        for row, changes in normalize_rows(doctype, rows, rules, matcher):
+            for fieldname, value in changes.items():
+                updates.setdefault(fieldname, {})[row.name] = value
+
+        for fieldname, values in updates.items():
+            write_column(doctype, fieldname, values)
+
+        frappe.db.commit()
+
+        updated = len({name for values in updates.values() for name in values})
+        stats.scanned += len(rows)
+        stats.updated += updated
+        stats.chunks += 1
+        last_name = rows[-1].name
+        logger.info(
+            f"{doctype}: chunk {stats.chunks} scanned {len(rows)}, updated {updated}"
+            f" in {time.monotonic() - chunk_started:.2f}s"
+        )
+
+    stats.duration = time.monotonic() - started
+    stats.rows_per_second = int(stats.scanned / stats.duration) if stats.duration else 0
+    logger.info(f"{doctype}: normalized {stats.updated} of {stats.scanned} rows at {stats.rows_per_second} rows/s")
+    return stats
@@ -0,0 +1,13 @@
+import frappe
+
+
+def write_column(doctype, fieldname, values):
+    """Set `fieldname` per name from {name: value} with a single CASE update."""
+    cases = " ".join(["when %s then %s"] * len(values))
+    placeholders = ", ".join(["%s"] * len(values))
+    params = [param for name, value in values.items() for param in (name, value)]
+    frappe.db.sql(
+        f"""update `tab{doctype}` set `{fieldname}` = case name {cases} else `{fieldname}` end
+        where name in ({placeholders})""",
+        (*params, *values),
+    )
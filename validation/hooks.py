@@ -34,7 +34,11 @@ override_whitelisted_methods = {
 
 # include js, css files in header of desk.html
 app_include_css = "/assets/validation/css/custom.css"
-app_include_js = "/assets/validation/js/global_autocorrect.js"
+app_include_js = [
+    "/assets/validation/js/automation_settings.js",
+    "/assets/validation/js/global_autocorrect.js",
+    "/assets/validation/js/party_dedupe.js",
+]
 
 
 # include js, css files in header of web template
@@ -115,6 +119,19 @@ doctype_js = {
 # before_install = "validation.install.before_install"
 # after_install = "validation.install.after_install"
 
+# Boot
+# ------------
+
+boot_session = "validation.validation.doctype.settings_for_automation.settings_for_automation.boot_session"
+
+# Migration
+# ------------
+
+after_migrate = [
+    "validation.validation.report.document_time_tracking.document_time_tracking.add_source_indexes",
+    "validation.customization.party_dedupe.add_party_indexes",
+]
+
 # Uninstallation
 # ------------
 
@@ -185,6 +202,9 @@ scheduler_events = {
 	"daily": [
 		"validation.validation.doctype.cleanup_settings.cleanup_settings.execute"
 	],
+	"hourly_long": [
+		"validation.validation.doctype.document_time_rollup.document_time_rollup.update_rollup"
+	],
 	# "hourly": [
 	# 	"validation.tasks.hourly"
 	# ],
@@ -279,14 +299,49 @@ doc_events = {
         "after_insert": "validation.customization.address.fetch_post_offices_on_save",
         "validate": ["validation.customization.territory.ensure_territory_from_address",
             "validation.customization.address.validate_address",
-             "validation.customization.address.validate"],
+             "validation.customization.address.validate",
+             "validation.customization.customer_address.set_address_title"],
         "on_update": "validation.customization.customer_address.update_customer_territory_from_address"
    },
     "Sales Order": {
         "before_submit": "validation.customization.sales_order.validate_packed_items_stock"
     },
+    "Item": {
+        "before_insert": "validation.validation.doctype.item_code_sequence.item_code_sequence.set_item_code",
+        "validate": "validation.customization.text_formatter.normalize_document"
+    },
+    "Customer": {
+        "before_naming": "validation.customization.text_formatter.normalize_document",
+        "validate": "validation.customization.text_formatter.normalize_document",
+        "before_save": "validation.customization.party_dedupe.set_normalized_name"
+    },
+    "Supplier": {
+        "before_naming": "validation.customization.text_formatter.normalize_document",
+        "validate": "validation.customization.text_formatter.normalize_document",
+        "before_save": "validation.customization.party_dedupe.set_normalized_name"
+    },
+    "Contact": {
+        "before_naming": "validation.customization.text_formatter.normalize_document",
+        "validate": "validation.customization.text_formatter.normalize_document",
+        "before_save": "validation.customization.party_dedupe.set_normalized_name"
+    },
     "*": {
         "validate": "validation.validation.doctype.private_dictionary.private_dictionary.global_validate_replacement"
+    },
+    "DocType": {
+        "on_update": "validation.validation.doctype.private_dictionary.private_dictionary.clear_replacement_plans"
+    },
+    "Custom Field": {
+        "on_update": "validation.validation.doctype.private_dictionary.private_dictionary.clear_replacement_plans",
+        "on_trash": "validation.validation.doctype.private_dictionary.private_dictionary.clear_replacement_plans"
+    },
+    "Property Setter": {
+        "on_update": "validation.validation.doctype.private_dictionary.private_dictionary.clear_replacement_plans",
+        "on_trash": "validation.validation.doctype.private_dictionary.private_dictionary.clear_replacement_plans"
+    },
+    "Territory": {
+        "on_trash": "validation.customization.territory.clear_territory_cache",
+        "after_rename": "validation.customization.territory.clear_territory_cache"
     }
 
 }
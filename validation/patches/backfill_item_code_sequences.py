@@ -0,0 +1,25 @@
+import frappe
+
+from validation.validation.doctype.item_code_sequence.item_code_sequence import ITEM_CODE_PATTERN
+
+
+def execute():
+	"""Start every abbreviation's Item Code Sequence after the highest code already in use."""
+	highest = {}
+	for item_code in frappe.db.sql_list("select item_code from `tabItem` where item_code like '% - %'"):
+		match = ITEM_CODE_PATTERN.match(item_code)
+		if match:
+			abbr = match.group("abbr")
+			highest[abbr] = max(highest.get(abbr, 0), int(match.group("number")))
+
+	for abbr, number in highest.items():
+		if frappe.db.exists("Item Code Sequence", abbr):
+			frappe.db.sql(
+				"""update `tabItem Code Sequence` set current_value = greatest(current_value, %s)
+				where name = %s""",
+				(number, abbr),
+			)
+		else:
+			frappe.get_doc({"doctype": "Item Code Sequence", "abbr": abbr, "current_value": number}).insert(
+				ignore_permissions=True
+			)
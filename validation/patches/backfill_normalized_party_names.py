@@ -0,0 +1,12 @@
+from frappe.modules.utils import sync_customizations
+
+from validation.customization.party_dedupe import PARTY_NAME_FIELDS, backfill_normalized_names
+
+
+def execute():
+	"""Compute the duplicate-detection key of every existing Customer, Supplier and Contact."""
+	# Custom fields are otherwise only synced after the post-model-sync patches
+	sync_customizations("validation")
+
+	for doctype in PARTY_NAME_FIELDS:
+		backfill_normalized_names(doctype)
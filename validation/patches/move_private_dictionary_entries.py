@@ -0,0 +1,39 @@
+import frappe
+from frappe.utils import cstr, now
+
+from validation.validation.doctype.private_dictionary.private_dictionary import (
+	ENTRY_DOCTYPE,
+	clear_dictionary_cache,
+	get_original_key,
+)
+
+
+def execute():
+	"""Move the rows of the old Private Dictionary child table into Private Dictionary Entry."""
+	if not frappe.db.table_exists("Dictionary"):
+		return
+
+	entries = {}
+	# Later rows overrode earlier ones in the matcher, so they win here as well
+	for original, suggested in frappe.db.sql(
+		"""select original_name, suggested_name from `tabDictionary`
+		where parent = 'Private Dictionary' order by idx"""
+	):
+		original, suggested = cstr(original).strip(), cstr(suggested).strip()
+		if original and suggested:
+			entries[get_original_key(original)] = (original, suggested)
+
+	existing = set(frappe.get_all(ENTRY_DOCTYPE, pluck="original_key"))
+	timestamp = now()
+	frappe.db.bulk_insert(
+		ENTRY_DOCTYPE,
+		fields=["name", "creation", "modified", "owner", "modified_by", "original_name", "suggested_name", "original_key"],
+		values=[
+			(frappe.generate_hash(length=10), timestamp, timestamp, "Administrator", "Administrator", original, suggested, key)
+			for key, (original, suggested) in entries.items()
+			if key not in existing
+		],
+	)
+
+	frappe.delete_doc("DocType", "Dictionary", ignore_missing=True, force=True)
+	clear_dictionary_cache()
@@ -178,11 +178,7 @@ function format_text(text, is_address_line1 = false) {
 }
 
 function check_automation_enabled(frm, callback) {
-    frappe.call({
-        method: 'frappe.client.get_single_value',
-        args: { doctype: 'Settings for Automation', field: 'enable_address_automation' },
-        callback: ({ message }) => callback(!!message)
-    });
+    callback(validation.automation_settings.is_enabled('enable_address_automation'));
 }
 
 function set_office_fields(frm, data) {
@@ -0,0 +1,20 @@
+// Automation flags from "Settings for Automation" and "Automation Settings".
+// They arrive with the boot info and are refreshed over realtime when either
+// single is saved, so form scripts can check them without a server call.
+frappe.provide('validation');
+
+validation.automation_settings = {
+    get(doctype = 'Settings for Automation') {
+        return (frappe.boot.automation_settings || {})[doctype] || {};
+    },
+
+    is_enabled(field, doctype = 'Settings for Automation') {
+        return !!this.get(doctype)[field];
+    }
+};
+
+$(document).on('app_ready', () => {
+    frappe.realtime.on('automation_settings_updated', (settings) => {
+        frappe.boot.automation_settings = settings;
+    });
+});
@@ -53,14 +53,7 @@ const FormHandler = {
     },
     
     checkAutomation(field, callback) {
-        frappe.call({
-            method: 'frappe.client.get_single_value',
-            args: {
-                doctype: 'Settings for Automation',
-                field: field
-            },
-            callback: (res) => callback(!!res.message)
-        });
+        callback(validation.automation_settings.is_enabled(field));
     }
 };
 
@@ -163,9 +163,5 @@ function update_full_name(frm) {
 }
 
 function check_automation_enabled(fieldname, callback) {
-    frappe.call({
-        method: 'frappe.client.get_single_value',
-        args: { doctype: 'Settings for Automation', field: fieldname },
-        callback: r => callback(!!r.message)
-    });
+    callback(validation.automation_settings.is_enabled(fieldname));
 }
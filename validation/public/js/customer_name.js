@@ -4,16 +4,7 @@ const FormHandler = {
     lastValues: new Map(),
 
     async isAutomationEnabled(field) {
-        try {
-            const { message } = await frappe.call({
-                method: 'frappe.client.get_single_value',
-                args: { doctype: 'Settings for Automation', field }
-            });
-            return !!message;
-        } catch (error) {
-            console.error('Automation check failed:', error);
-            return false;
-        }
+        return validation.automation_settings.is_enabled(field);
     },
 
     handle(frm, fieldname, automationField, formatFunction, realTimeFunction) {
@@ -185,6 +176,10 @@ const Utils = {
 
 // ================== Business Logic Functions ==================
 const CustomerLogic = {
+    checkDuplicates(frm) {
+        validation.party_dedupe.check(frm, frm.doc.customer_name, frm.doc.custom_mobile);
+    },
+
     async handleAddressUpdate(frm) {
         if (frm.doc.custom_automate !== 1 || !frm.doc.customer_primary_address) return;
 
@@ -424,9 +419,11 @@ frappe.ui.form.on('Customer', {
 
     custom_mobile(frm) {
         CustomerLogic.validateMobile(frm);
+        CustomerLogic.checkDuplicates(frm);
     },
 
     customer_name(frm) {
+        CustomerLogic.checkDuplicates(frm);
         FormHandler.handle(
             frm,
             'customer_name',
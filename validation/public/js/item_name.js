@@ -89,59 +89,11 @@ const FormHandler = {
     },
 
     checkAutomation(field, callback) {
-        frappe.call({
-            method: 'frappe.client.get_single_value',
-            args: {
-                doctype: 'Settings for Automation',
-                field: field
-            },
-            callback: (res) => callback(!!res.message)
-        });
+        callback(validation.automation_settings.is_enabled(field));
     },
 
     getItemAutomationSettings(callback) {
-        frappe.call({
-            method: 'frappe.client.get',
-            args: {
-                doctype: 'Settings for Automation',
-                name: 'Settings for Automation'
-            },
-            callback: function(response) {
-                if (response.message) {
-                    callback({
-                        enable_item_automation: response.message.enable_item_automation || 0,
-                        item_code_automation: response.message.item_code_automation || 0,
-                        item_name_automation: response.message.item_name_automation || 0,
-                        description_automation: response.message.description_automation || 0
-                    });
-                } else {
-                    FormHandler.getItemAutomationSettingsIndividual(callback);
-                }
-            }
-        });
-    },
-
-    getItemAutomationSettingsIndividual(callback) {
-        const settings = {};
-        const fields = ['enable_item_automation', 'item_code_automation', 'item_name_automation', 'description_automation'];
-        let completed = 0;
-
-        fields.forEach(field => {
-            frappe.call({
-                method: 'frappe.client.get_single_value',
-                args: {
-                    doctype: 'Settings for Automation',
-                    field: field
-                },
-                callback: function(response) {
-                    settings[field] = response.message || 0;
-                    completed++;
-                    if (completed === fields.length) {
-                        callback(settings);
-                    }
-                }
-            });
-        });
+        callback(validation.automation_settings.get());
     }
 };
 
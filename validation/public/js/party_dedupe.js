@@ -0,0 +1,35 @@
+// Possible-duplicate warning shared by the Customer and Supplier forms.
+// Matches come from party_dedupe.find_similar_parties and are shown as a
+// dashboard headline linking to each similar party.
+frappe.provide('validation');
+
+validation.party_dedupe = {
+    METHOD: 'validation.customization.party_dedupe.find_similar_parties',
+    timeout: null,
+
+    check(frm, name, mobile) {
+        if (!frm.is_new()) return;
+
+        clearTimeout(this.timeout);
+        this.timeout = setTimeout(() => {
+            frappe.call({
+                method: this.METHOD,
+                args: { name, mobile },
+                callback: (r) => this.show(frm, r.message || [])
+            });
+        }, 500);
+    },
+
+    show(frm, matches) {
+        if (!matches.length) {
+            frm.dashboard.clear_headline();
+            return;
+        }
+
+        const links = matches.map(({ doctype, name, title, matched_on }) =>
+            `<a href="/app/${frappe.router.slug(doctype)}/${encodeURIComponent(name)}">${frappe.utils.escape_html(title || name)}</a>`
+            + ` (${__(doctype)}, ${__('matched on {0}', [__(matched_on)])})`
+        );
+        frm.dashboard.set_headline_alert(`${__('Possible duplicates')}: ${links.join(', ')}`, 'orange');
+    }
+};
@@ -45,11 +45,7 @@ const FormHandler = {
     },
 
     checkAutomation(field, cb) {
-        frappe.call({
-            method: 'frappe.client.get_single_value',
-            args: { doctype: 'Settings for Automation', field },
-            callback: res => cb(!!res.message)
-        });
+        cb(validation.automation_settings.is_enabled(field));
     }
 };
 
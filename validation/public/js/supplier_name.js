@@ -52,11 +52,7 @@ const FormHandler = {
     },
 
     checkAutomation(field, callback) {
-        frappe.call({
-            method: 'frappe.client.get_single_value',
-            args: { doctype: 'Settings for Automation', field },
-            callback: (res) => callback(!!res.message)
-        });
+        callback(validation.automation_settings.is_enabled(field));
     }
 };
 
@@ -127,6 +123,7 @@ frappe.ui.form.on('Supplier', {
     },
 
     supplier_name(frm) {
+        validation.party_dedupe.check(frm, frm.doc.supplier_name, frm.doc.mobile_no);
         FormHandler.handle(
             frm,
             'supplier_name',
@@ -1,9 +1,13 @@
 # Copyright (c) 2025, Ameer Babu and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
 
+from validation.customization.address import clear_tax_category_rules
+
 
 class AutomateDefaultValues(Document):
-	pass
+	def on_update(self):
+		# Workers rebuild the index only once the new rows are committed
+		frappe.db.after_commit.add(clear_tax_category_rules)
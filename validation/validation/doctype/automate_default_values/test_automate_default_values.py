@@ -1,9 +1,20 @@
 # Copyright (c) 2025, Ameer Babu and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from validation.customization.address import TAX_CATEGORY_RULES_KEY, get_tax_category
+
 
 class TestAutomateDefaultValues(FrappeTestCase):
-	pass
+	def test_tax_category_rules(self):
+		frappe.cache().set_value(
+			TAX_CATEGORY_RULES_KEY,
+			{"countries": {"India"}, "states": {("India", "Kerala")}},
+		)
+		self.addCleanup(frappe.cache().delete_value, TAX_CATEGORY_RULES_KEY)
+
+		self.assertEqual(get_tax_category("India", "Kerala"), "In-State")
+		self.assertEqual(get_tax_category("India", "Goa"), "Out-State")
+		self.assertEqual(get_tax_category("Nepal", "Bagmati"), "Overseas")
@@ -4,6 +4,11 @@
 # import frappe
 from frappe.model.document import Document
 
+from validation.validation.doctype.settings_for_automation.settings_for_automation import (
+	publish_automation_settings,
+)
+
 
 class AutomationSettings(Document):
-	pass
+	def on_update(self):
+		publish_automation_settings(self)
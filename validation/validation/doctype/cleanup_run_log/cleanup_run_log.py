@@ -0,0 +1,68 @@
+# Copyright (c) 2025, Ameer Babu and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import now_datetime, time_diff_in_seconds
+
+
+class CleanupRunLog(Document):
+	def add_result(self, ref_doctype, threshold=None, stats=None, status=None, failures=None, **filters):
+		"""Record the outcome of one cleanup target; `stats` is what `delete_documents` returned."""
+		row = self.append(
+			"details",
+			{
+				"ref_doctype": ref_doctype,
+				"threshold": threshold,
+				"status": status or "Completed",
+				"failures": failures,
+				**filters,
+			},
+		)
+		if stats:
+			row.update(
+				{
+					"strategy": stats.strategy,
+					"deleted": stats.deleted,
+					"failed": stats.failed,
+					"duration": stats.duration,
+					"rows_per_second": stats.rows_per_second,
+					"failures": format_failures(stats.failures),
+				}
+			)
+		return row
+
+	def finish(self, status=None):
+		"""Fill in the totals and write the log.
+
+		Without an explicit `status` the run takes the worst status of its rows.
+		Runs without queued work are written only here; the others are inserted
+		when queued and updated in place.
+		"""
+		statuses = {row.status for row in self.details}
+		self.status = status or (
+			"Failed" if "Failed" in statuses else "Carried Over" if "Carried Over" in statuses else "Completed"
+		)
+		self.finished_at = now_datetime()
+		self.duration = time_diff_in_seconds(self.finished_at, self.started_at)
+		self.total_deleted = sum(row.deleted or 0 for row in self.details)
+		self.total_failed = sum(row.failed or 0 for row in self.details)
+		self.rows_per_second = self.total_deleted / self.duration if self.duration else 0
+		if self.is_new():
+			self.insert(ignore_permissions=True)
+		else:
+			# The job only owns the counters; skip the timestamp check a cancel would trip
+			self.db_update_all()
+		frappe.db.commit()
+
+
+def new_run_log(run_type):
+	return frappe.get_doc(
+		{"doctype": "Cleanup Run Log", "run_type": run_type, "status": "Running", "started_at": now_datetime()}
+	)
+
+
+def format_failures(failures, existing=None):
+	lines = [existing] if existing else []
+	lines.extend(f"{failure['name']}: {failure['error']}" for failure in failures)
+	return "\n".join(lines)
@@ -0,0 +1,24 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.doctype.cleanup_run_log.cleanup_run_log import new_run_log
+
+
+class TestCleanupRunLog(FrappeTestCase):
+	def test_finish_rolls_up_totals(self):
+		run_log = new_run_log("Manual")
+		stats = frappe._dict(
+			strategy="Bulk", deleted=40, failed=2, duration=2.0, rows_per_second=20.0,
+			failures=[{"name": "X-1", "error": "Linked"}],
+		)
+		run_log.add_result("ToDo", stats=stats)
+		run_log.add_result("Note", status="Skipped", failures="Invalid clear_logs_after value")
+		run_log.finish()
+
+		self.assertEqual(run_log.total_deleted, 40)
+		self.assertEqual(run_log.total_failed, 2)
+		self.assertEqual(run_log.details[0].failures, "X-1: Linked")
+		self.assertTrue(frappe.db.exists("Cleanup Run Log", run_log.name))
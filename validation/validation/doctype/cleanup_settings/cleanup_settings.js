@@ -1,4 +1,15 @@
 frappe.ui.form.on('Cleanup Settings', {
+    onload: function(frm) {
+        frappe.realtime.on('cleanup_progress', (data) => {
+            show_cleanup_progress(frm, data);
+            if (data.status !== 'Running') {
+                setup_cleanup_buttons(frm);
+            }
+        });
+    },
+    refresh: function(frm) {
+        setup_cleanup_buttons(frm);
+    },
     delete_now: function(frm) {
             if (!frm.doc.manual_doctype || !frm.doc.created_before) {
                 frappe.msgprint("Please select Manual Doctype and Created Before date");
@@ -10,10 +21,13 @@ frappe.ui.form.on('Cleanup Settings', {
                 args: {
                     doctype: frm.doc.manual_doctype,
                     created_before: frm.doc.created_before,
-                    docstatus: frm.doc.doc_status || 0
+                    docstatus: frm.doc.doc_status || 'Draft',
+                    created_by: frm.doc.created_by
                 },
                 callback: function(r) {
-                    frappe.msgprint(r.message);
+                    frappe.show_alert({message: __('Cleanup queued: {0}', [r.message]), indicator: 'blue'});
+                    show_cleanup_progress(frm, {run_log: r.message, status: 'Queued', deleted: 0, failed: 0});
+                    setup_cleanup_buttons(frm);
                 }
             });
     },
@@ -21,7 +35,7 @@ frappe.ui.form.on('Cleanup Settings', {
             frm.set_value('manual_doctype', '');
             frm.set_value('created_before', '');
             frm.set_value('created_by', '')
-            frm.set_value('doc_status', "");
+            frm.set_value('doc_status', 'Draft');
     },
     preview_count(frm) {
         if (!frm.doc.manual_doctype || !frm.doc.created_before) {
@@ -29,31 +43,90 @@ frappe.ui.form.on('Cleanup Settings', {
             return;
         }
 
-        let filters = [
-            ['creation', '<=', frm.doc.created_before]
-        ];
-
-        if (frm.doc.created_by) {
-            filters.push(['owner', '=', frm.doc.created_by]);
-        }
-
-        if (frm.doc.doc_status !== undefined && frm.doc.doc_status !== null && frm.doc.doc_status !== '') {
-            filters.push(['docstatus', '=', frm.doc.doc_status]);
-        }
+        let args = {
+            doctype: frm.doc.manual_doctype,
+            created_before: frm.doc.created_before,
+            docstatus: frm.doc.doc_status || 'Draft',
+            created_by: frm.doc.created_by
+        };
 
         frappe.call({
-            method: 'frappe.desk.reportview.get_count',
-            args: {
-                doctype: frm.doc.manual_doctype,
-                filters: filters
-            },
+            method: `${CLEANUP_METHOD}.preview_cleanup`,
+            args: args,
             callback: function(r) {
-                if (r.message !== undefined) {
-                    frm.fields_dict.more_info.$wrapper.html(
-                        `<div style="margin-top: 10px;color:green;"><b>Total Documents:</b> ${r.message}</div>`
-                    );
-                }
+                if (!r.message) return;
+
+                let preview = r.message;
+                let count = preview.exact_count !== null
+                    ? `<b>Total Documents:</b> ${preview.exact_count}`
+                    : `<b>${__('Rows to Scan')}:</b> ~${preview.rows_scanned} (${__('matching documents not counted')})`;
+                let eta = preview.estimated_seconds !== null
+                    ? `<br><b>Estimated Time:</b> ${preview.exact_count !== null ? '' : __('up to') + ' '}${frappe.utils.get_formatted_duration(preview.estimated_seconds)}`
+                    : '';
+                let index = preview.index
+                    ? `<br><b>Index Used:</b> ${frappe.utils.escape_html(preview.index)}`
+                    : `<br><span style="color:orange;">${__('No index covers these filters; deletion will scan the whole table.')}</span>
+                       <button class="btn btn-xs btn-default add-cleanup-index">${__('Add Index on ({0})', [preview.suggested_index.join(', ')])}</button>`;
+
+                frm.fields_dict.more_info.$wrapper.html(
+                    `<div style="margin-top: 10px;color:green;">${count} (${__(preview.strategy)})${eta}${index}</div>`
+                );
+                frm.fields_dict.more_info.$wrapper.find('.add-cleanup-index').on('click', () => {
+                    frappe.call({
+                        method: `${CLEANUP_METHOD}.add_cleanup_index`,
+                        args: {doctype: args.doctype, created_by: args.created_by, docstatus: args.docstatus},
+                        callback: (r) => frappe.show_alert(__('Index {0} is being built in the background', [r.message]))
+                    });
+                });
             }
         });
     }
 });
+
+const CLEANUP_METHOD = 'validation.validation.doctype.cleanup_settings.cleanup_settings';
+
+function show_cleanup_progress(frm, data) {
+    let percent = data.total ? Math.min(100, Math.round(data.deleted * 100 / data.total)) : 0;
+    frm.fields_dict.more_info.$wrapper.html(
+        `<div style="margin-top: 10px;">
+            <b>${frappe.utils.escape_html(data.run_log)}:</b> ${__(data.status)} -
+            ${__('Deleted')} ${data.deleted || 0}${data.total ? ' / ' + data.total : ''},
+            ${__('Failed')} ${data.failed || 0}
+            <div class="progress" style="margin-top: 5px;">
+                <div class="progress-bar" style="width: ${percent}%"></div>
+            </div>
+        </div>`
+    );
+}
+
+function setup_cleanup_buttons(frm) {
+    frm.remove_custom_button(__('Cancel Cleanup'));
+    frm.remove_custom_button(__('Resume Cleanup'));
+
+    frappe.call({
+        method: `${CLEANUP_METHOD}.get_latest_manual_cleanup`,
+        callback: function(r) {
+            let run = r.message;
+            if (!run) return;
+
+            if (['Queued', 'Running'].includes(run.status) && run.job_running) {
+                frm.add_custom_button(__('Cancel Cleanup'), () => {
+                    frappe.call({
+                        method: `${CLEANUP_METHOD}.cancel_manual_cleanup`,
+                        args: {run_log: run.name},
+                        callback: () => frappe.show_alert(__('Cleanup will stop after the current chunk'))
+                    });
+                });
+            } else if (run.status !== 'Completed') {
+                // Cancelled, failed, or its worker was killed mid-run
+                frm.add_custom_button(__('Resume Cleanup'), () => {
+                    frappe.call({
+                        method: `${CLEANUP_METHOD}.resume_manual_cleanup`,
+                        args: {run_log: run.name},
+                        callback: () => setup_cleanup_buttons(frm)
+                    });
+                });
+            }
+        }
+    });
+}
@@ -1,102 +1,830 @@
 # Copyright (c) 2025, Ameer Babu and contributors
 # For license information, please see license.txt
 
+import time
+
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import now_datetime, add_days, getdate
+from frappe.model.dynamic_links import get_dynamic_link_map
+from frappe.utils import now, now_datetime, add_days, add_to_date, getdate, cint
+
+from frappe.utils.background_jobs import is_job_enqueued
+
+from validation.validation.doctype.cleanup_run_log.cleanup_run_log import format_failures, new_run_log
+
+# Rows deleted (and committed) per round trip
+CHUNK_SIZE = 1000
+
+# Per-document failures kept in the run summary; the rest are only counted
+MAX_RECORDED_FAILURES = 20
+
+# Labels used by the Doc Status select in Cleanup Settings and Cleanup Document
+DOCSTATUS_BY_LABEL = {"Draft": 0, "Submitted": 1, "Cancelled": 2}
+
+# Manual cleanups only widen to every status when "All" is picked explicitly
+MANUAL_DOC_STATUS = "Draft"
+
+# Controller methods and doc_events that a direct DELETE would silently skip
+DELETE_EVENTS = ("on_trash", "after_delete")
+
+# (DocType, reference DocType column, reference name column) of the records
+# frappe.delete_doc deletes along with a document; bulk deletion does the same
+DEPENDENT_RECORDS = (
+    ("Comment", "reference_doctype", "reference_name"),
+    ("ToDo", "reference_type", "reference_name"),
+    ("DocShare", "share_doctype", "share_name"),
+    ("Version", "ref_doctype", "docname"),
+    ("View Log", "reference_doctype", "reference_name"),
+    ("Document Follow", "ref_doctype", "ref_docname"),
+    ("Notification Log", "document_type", "document_name"),
+    ("Tag Link", "document_type", "document_name"),
+    ("Communication Link", "link_doctype", "link_name"),
+)
+
+# References frappe.delete_doc only clears, keeping the referring record
+CLEARED_REFERENCES = (
+    ("Communication", "reference_doctype", "reference_name"),
+    ("Activity Log", "reference_doctype", "reference_name"),
+    ("Activity Log", "timeline_doctype", "timeline_name"),
+)
+
+KEYSET_CONDITION = "and (creation > %(last_creation)s or (creation = %(last_creation)s and name > %(last_name)s))"
+
+# Timeout for cleanup jobs on the long queue; a killed manual run resumes from its checkpoint
+LONG_JOB_TIMEOUT = 4 * 60 * 60
+
+# Lanes may run one more chunk past the run's time budget; after this they are killed
+LANE_TIMEOUT_MARGIN = 10 * 60
+
+# Previews count exactly on unindexed filters only below this many rows
+EXACT_COUNT_SCAN_LIMIT = 200_000
+
+# Past runs averaged for the preview's run time estimate
+RATE_SAMPLE_SIZE = 10
+
 
 class CleanupSettings(Document):
     pass
 
+
+def get_docstatus_filter(doc_status):
+    """Map a Doc Status label (or a plain number) to a docstatus; None means any status."""
+    if doc_status in (None, "", "All"):
+        return None
+    if doc_status in DOCSTATUS_BY_LABEL:
+        return DOCSTATUS_BY_LABEL[doc_status]
+    return cint(doc_status)
+
+
+def can_bulk_delete(doctype):
+    """True when rows of `doctype` can be deleted with plain SQL.
+
+    That holds when no controller or doc_event reacts to deletion, nothing is
+    tracked per document (submission, tree structure), no other DocType links
+    here and no files are attached. The backups and references frappe.delete_doc
+    handles for every document are then taken care of in bulk.
+    """
+    meta = frappe.get_meta(doctype)
+    if meta.is_submittable or meta.is_tree or meta.issingle or meta.istable or meta.is_virtual:
+        return False
+
+    doc_hooks = frappe.get_doc_hooks()
+    for key in (doctype, "*"):
+        if any(event in doc_hooks.get(key, {}) for event in DELETE_EVENTS):
+            return False
+
+    controller = frappe.get_controller(doctype)
+    for event in DELETE_EVENTS:
+        if getattr(controller, event, None) is not getattr(Document, event, None):
+            return False
+
+    link_filters = {"fieldtype": "Link", "options": doctype}
+    if frappe.get_all("DocField", filters=link_filters, limit=1) or frappe.get_all(
+        "Custom Field", filters=link_filters, limit=1
+    ):
+        return False
+
+    # Attachments have to go through File.on_trash to leave the disk
+    if frappe.db.exists("File", {"attached_to_doctype": doctype}):
+        return False
+
+    # Dynamic Links other than the generic references cleaned up in bulk would dangle
+    handled = {reference[0] for reference in DEPENDENT_RECORDS + CLEARED_REFERENCES}
+    if any(df.parent not in handled for df in get_dynamic_link_map().get(doctype, [])):
+        return False
+
+    return True
+
+
+def delete_documents(
+    doctype,
+    created_before,
+    created_by=None,
+    docstatus=None,
+    force=False,
+    ignore_permissions=False,
+    chunk_size=CHUNK_SIZE,
+    start_after=None,
+    on_chunk=None,
+    max_rows_per_second=0,
+):
+    """Delete every `doctype` record created before `created_before`, one chunk at a time.
+
+    Each chunk is committed on its own so a long purge never holds one huge
+    transaction or loads every matching name into memory. For DocTypes that
+    pass `can_bulk_delete`, each chunk selects the rows, backs them up to
+    Deleted Document, deletes their child rows and references, then deletes
+    them with `DELETE ... WHERE name IN`. The others are paged by
+    (creation, name) and deleted through `frappe.delete_doc`.
+
+    `start_after` is a (creation, name) checkpoint to resume per-document
+    deletion from. `on_chunk(stats, last_key)` runs inside each chunk's
+    transaction, before its commit, so a checkpoint written there is committed
+    together with the deletions; returning True stops after that chunk.
+    `max_rows_per_second` throttles by sleeping between chunks, after their
+    commit so no locks are held while waiting.
+
+    Returns a dict with the strategy used, deleted/failed counts, the first
+    failures and the overall rate.
+    """
+    conditions, values = _candidate_conditions(created_before, created_by, docstatus)
+
+    stats = frappe._dict(
+        doctype=doctype,
+        strategy="Bulk" if can_bulk_delete(doctype) else "Per Document",
+        deleted=0,
+        failed=0,
+        chunks=0,
+        failures=[],
+        stopped=False,
+    )
+    started = time.monotonic()
+
+    if max_rows_per_second:
+        # Keep a chunk to about a second's worth of rows so the pace stays even
+        chunk_size = max(1, min(chunk_size, cint(max_rows_per_second)))
+
+    if stats.strategy == "Bulk":
+        chunks = _bulk_delete_chunks(doctype, conditions, values, chunk_size)
+    else:
+        chunks = _per_document_chunks(
+            doctype, conditions, values, chunk_size, force, ignore_permissions, stats, start_after
+        )
+
+    for deleted, failed, duration, last_key in chunks:
+        stats.chunks += 1
+        stats.deleted += deleted
+        stats.failed += failed
+        if on_chunk and on_chunk(stats, last_key):
+            stats.stopped = True
+        frappe.db.commit()
+        frappe.logger("cleanup").info(
+            f"{doctype}: chunk {stats.chunks} deleted {deleted}, failed {failed} "
+            f"in {duration:.2f}s ({_rate(deleted, duration):.0f} rows/s)"
+        )
+        if stats.stopped:
+            break
+
+        if max_rows_per_second:
+            ahead = stats.deleted / max_rows_per_second - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    stats.duration = time.monotonic() - started
+    stats.rows_per_second = _rate(stats.deleted, stats.duration)
+    return stats
+
+
+def _candidate_conditions(created_before, created_by=None, docstatus=None):
+    conditions = ["creation < %(created_before)s"]
+    values = {"created_before": created_before}
+
+    if created_by:
+        conditions.append("owner = %(created_by)s")
+        values["created_by"] = created_by
+
+    if docstatus is not None:
+        conditions.append("docstatus = %(docstatus)s")
+        values["docstatus"] = docstatus
+
+    return conditions, values
+
+
+def _bulk_delete_chunks(doctype, conditions, values, chunk_size):
+    where = " and ".join(conditions)
+    table_fields = frappe.get_meta(doctype).get_table_fields()
+
+    while True:
+        chunk_started = time.monotonic()
+        rows = frappe.db.sql(
+            f"select * from `tab{doctype}` where {where} order by creation, name limit {cint(chunk_size)}",
+            values,
+            as_dict=True,
+        )
+        if not rows:
+            return
+
+        names = [row.name for row in rows]
+        _backup_documents(doctype, rows, table_fields)
+        for child in {df.options for df in table_fields}:
+            frappe.db.sql(
+                f"delete from `tab{child}` where parenttype = %(doctype)s and parent in %(names)s",
+                {"doctype": doctype, "names": names},
+            )
+        _delete_references(doctype, names)
+        frappe.db.sql(f"delete from `tab{doctype}` where name in %(names)s", {"names": names})
+
+        # Nothing is left behind here, so there is no key to resume from
+        yield len(names), 0, time.monotonic() - chunk_started, None
+        if len(names) < chunk_size:
+            return
+
+
+def _backup_documents(doctype, rows, table_fields):
+    """Write the Deleted Document backups frappe.delete_doc would, one insert per chunk."""
+    if doctype == "Deleted Document":
+        return
+
+    by_name = {}
+    for row in rows:
+        row.doctype = doctype
+        by_name[row.name] = row
+
+    for df in table_fields:
+        for child in frappe.db.sql(
+            f"""select * from `tab{df.options}`
+            where parenttype = %(doctype)s and parentfield = %(fieldname)s and parent in %(names)s
+            order by idx""",
+            {"doctype": doctype, "fieldname": df.fieldname, "names": list(by_name)},
+            as_dict=True,
+        ):
+            child.doctype = df.options
+            by_name[child.parent].setdefault(df.fieldname, []).append(child)
+
+    timestamp = now()
+    user = frappe.session.user
+    frappe.db.bulk_insert(
+        "Deleted Document",
+        fields=["name", "creation", "modified", "owner", "modified_by", "deleted_doctype", "deleted_name", "data"],
+        values=[
+            (frappe.generate_hash(length=10), timestamp, timestamp, user, user, doctype, row.name, frappe.as_json(row))
+            for row in rows
+        ],
+    )
+
+
+def _delete_references(doctype, names):
+    """Bulk version of the comment, assignment, share, tag and timeline cleanup of frappe.delete_doc."""
+    values = {"doctype": doctype, "names": names}
+
+    for reference_doctype, doctype_column, name_column in DEPENDENT_RECORDS:
+        frappe.db.sql(
+            f"""delete from `tab{reference_doctype}`
+            where `{doctype_column}` = %(doctype)s and `{name_column}` in %(names)s""",
+            values,
+        )
+
+    for reference_doctype, doctype_column, name_column in CLEARED_REFERENCES:
+        frappe.db.sql(
+            f"""update `tab{reference_doctype}` set `{doctype_column}` = null, `{name_column}` = null
+            where `{doctype_column}` = %(doctype)s and `{name_column}` in %(names)s""",
+            values,
+        )
+
+
+def _per_document_chunks(doctype, conditions, values, chunk_size, force, ignore_permissions, stats, start_after):
+    where = " and ".join(conditions)
+    after = ""
+    values = dict(values)
+
+    if start_after:
+        after = KEYSET_CONDITION
+        values.update(last_creation=start_after[0], last_name=start_after[1])
+
+    while True:
+        chunk_started = time.monotonic()
+        rows = frappe.db.sql(
+            f"""select name, creation from `tab{doctype}`
+            where {where} {after}
+            order by creation, name
+            limit {cint(chunk_size)}""",
+            values,
+            as_dict=True,
+        )
+        if not rows:
+            return
+
+        deleted = failed = 0
+        for row in rows:
+            frappe.db.savepoint("cleanup_delete")
+            try:
+                frappe.delete_doc(doctype, row.name, force=force, ignore_permissions=ignore_permissions)
+                deleted += 1
+            except Exception as e:
+                frappe.db.rollback(save_point="cleanup_delete")
+                failed += 1
+                if len(stats.failures) < MAX_RECORDED_FAILURES:
+                    stats.failures.append({"name": row.name, "error": str(e)[:140]})
+
+        # Rows that failed stay behind, so continue after the last key seen
+        after = KEYSET_CONDITION
+        values.update(last_creation=rows[-1].creation, last_name=rows[-1].name)
+
+        yield deleted, failed, time.monotonic() - chunk_started, (rows[-1].creation, rows[-1].name)
+        if len(rows) < chunk_size:
+            return
+
+
+def _rate(rows, duration):
+    return rows / duration if duration else 0.0
+
+
 @frappe.whitelist()
-def delete_manual_docs(doctype, created_before, docstatus=None, created_by=None):
-    """Manually delete documents matching the selected filters."""
+def preview_cleanup(doctype, created_before, docstatus=None, created_by=None):
+    """Estimate what a cleanup with these filters would delete, and how long it would take.
+
+    EXPLAIN only tells how many rows the delete would scan, which bounds the
+    matching documents from above; they are counted exactly when an index
+    serves the filters or the scan is small enough to run quickly.
+    """
+    frappe.only_for("System Manager")
 
     if not doctype or not created_before:
         frappe.throw(_("Please select Doctype and Created Before date"))
 
-    filters = {
-        "creation": ["<", getdate(created_before)]
+    frappe.get_meta(doctype)
+    docstatus = docstatus or MANUAL_DOC_STATUS
+    conditions, values = _candidate_conditions(getdate(created_before), created_by, get_docstatus_filter(docstatus))
+    where = " and ".join(conditions)
+
+    plan = frappe.db.sql(f"explain select count(*) from `tab{doctype}` where {where}", values, as_dict=True)[0]
+    index = plan.get("key")
+    rows_scanned = cint(plan.get("rows"))
+
+    exact = None
+    if index or rows_scanned <= EXACT_COUNT_SCAN_LIMIT:
+        exact = frappe.db.sql(f"select count(*) from `tab{doctype}` where {where}", values)[0][0]
+
+    rows_per_second = _past_rows_per_second(doctype)
+    # Without an exact count the time is an upper bound from the rows scanned
+    count = exact if exact is not None else rows_scanned
+
+    return {
+        "rows_scanned": rows_scanned,
+        "exact_count": exact,
+        "index": index,
+        "strategy": "Bulk" if can_bulk_delete(doctype) else "Per Document",
+        "rows_per_second": rows_per_second,
+        "estimated_seconds": count / rows_per_second if rows_per_second else None,
+        "suggested_index": None if index else get_cleanup_index_columns(created_by, docstatus),
     }
 
+
+def get_cleanup_index_columns(created_by=None, docstatus=None):
+    """Columns of a composite index serving the cleanup filters.
+
+    Equality filters lead and the `creation` range comes last, so the index
+    narrows on owner/docstatus before it walks the date range.
+    """
+    columns = []
+    if created_by:
+        columns.append("owner")
+    if get_docstatus_filter(docstatus) is not None:
+        columns.append("docstatus")
+    return columns + ["creation"]
+
+
+@frappe.whitelist()
+def add_cleanup_index(doctype, created_by=None, docstatus=None):
+    """Queue creation of the composite index suggested by `preview_cleanup`."""
+    frappe.only_for("System Manager")
+
+    meta = frappe.get_meta(doctype)
+    if meta.issingle or meta.is_virtual:
+        frappe.throw(_("{0} has no table to index").format(doctype))
+
+    columns = get_cleanup_index_columns(created_by, docstatus)
+    index_name = "cleanup_" + "_".join(columns)
+    if frappe.db.has_index(f"tab{doctype}", index_name):
+        return index_name
+
+    # Building an index on a large table takes a while; keep it off the web worker
+    frappe.enqueue(
+        "validation.validation.doctype.cleanup_settings.cleanup_settings.build_cleanup_index",
+        queue="long",
+        timeout=LONG_JOB_TIMEOUT,
+        job_id=f"cleanup_index::{doctype}::{index_name}",
+        deduplicate=True,
+        doctype=doctype,
+        columns=columns,
+        index_name=index_name,
+    )
+    return index_name
+
+
+def build_cleanup_index(doctype, columns, index_name):
+    frappe.db.add_index(doctype, columns, index_name)
+
+
+def _past_rows_per_second(doctype):
+    rates = frappe.get_all(
+        "Cleanup Run Log Detail",
+        filters={"ref_doctype": doctype, "parenttype": "Cleanup Run Log", "deleted": [">", 0]},
+        order_by="creation desc",
+        limit=RATE_SAMPLE_SIZE,
+        pluck="rows_per_second",
+    )
+    return sum(rates) / len(rates) if rates else None
+
+
+@frappe.whitelist()
+def delete_manual_docs(doctype, created_before, docstatus=None, created_by=None):
+    """Queue a manual cleanup for the selected filters and return its Cleanup Run Log."""
+    frappe.only_for("System Manager")
+
+    if not doctype or not created_before:
+        frappe.throw(_("Please select Doctype and Created Before date"))
+
+    frappe.has_permission(doctype, "delete", throw=True)
+
+    docstatus = docstatus or MANUAL_DOC_STATUS
+    filters = {"creation": ["<", getdate(created_before)]}
     if created_by:
         filters["owner"] = created_by
+    if get_docstatus_filter(docstatus) is not None:
+        filters["docstatus"] = get_docstatus_filter(docstatus)
 
-    if docstatus is not None and docstatus != "":
-        filters["docstatus"] = int(docstatus)
+    run_log = new_run_log("Manual")
+    run_log.status = "Queued"
+    run_log.add_result(
+        doctype,
+        getdate(created_before),
+        status="Queued",
+        created_by=created_by,
+        doc_status=docstatus,
+        # Counted once here; resumed runs report progress against the same total
+        total_documents=frappe.db.count(doctype, filters),
+    )
+    run_log.insert(ignore_permissions=True)
 
-    docs = frappe.get_all(doctype, filters=filters, pluck="name")
+    enqueue_manual_cleanup(run_log.name)
+    return run_log.name
 
-    deleted = []
-    skipped = []
 
-    for name in docs:
-        try:
-            doc = frappe.get_doc(doctype, name)
-            doc.delete()
-            deleted.append(name)
-            frappe.log_error(f"Deleted {doctype} record: {name}", "Manual Cleanup Success")
-        except Exception as e:
-            skipped.append(name)
-            frappe.log_error(
-                title=f"Delete Error: {doctype} {name}",
-                message=str(e)[:130]
-            )
+@frappe.whitelist()
+def cancel_manual_cleanup(run_log):
+    """Ask a queued or running manual cleanup to stop after its current chunk."""
+    frappe.only_for("System Manager")
+
+    if frappe.db.get_value("Cleanup Run Log", run_log, "status") not in ("Queued", "Running"):
+        frappe.throw(_("Only a queued or running cleanup can be cancelled"))
+
+    frappe.db.set_value("Cleanup Run Log", run_log, "status", "Cancelled", update_modified=False)
+
+
+@frappe.whitelist()
+def resume_manual_cleanup(run_log):
+    """Re-queue a cancelled, failed or interrupted manual cleanup from its last checkpoint."""
+    frappe.only_for("System Manager")
+
+    status = frappe.db.get_value("Cleanup Run Log", run_log, "status")
+    if status == "Completed" or is_job_enqueued(_job_id(run_log)):
+        frappe.throw(_("This cleanup is already finished or still running"))
+
+    frappe.db.set_value("Cleanup Run Log", run_log, "status", "Queued", update_modified=False)
+    enqueue_manual_cleanup(run_log)
+
+
+@frappe.whitelist()
+def get_latest_manual_cleanup():
+    """The most recent manual run, for the Cleanup Settings form to show progress and actions."""
+    frappe.only_for("System Manager")
+
+    run_log = frappe.get_all(
+        "Cleanup Run Log",
+        filters={"run_type": "Manual"},
+        fields=["name", "status", "total_deleted", "total_failed"],
+        order_by="creation desc",
+        limit=1,
+    )
+    if not run_log:
+        return None
+
+    run_log = run_log[0]
+    run_log.job_running = is_job_enqueued(_job_id(run_log.name))
+    return run_log
+
+
+def enqueue_manual_cleanup(run_log):
+    frappe.enqueue(
+        "validation.validation.doctype.cleanup_settings.cleanup_settings.run_manual_cleanup",
+        queue="long",
+        timeout=LONG_JOB_TIMEOUT,
+        job_id=_job_id(run_log),
+        deduplicate=True,
+        enqueue_after_commit=True,
+        run_log=run_log,
+    )
+
+
+def _job_id(run_log):
+    return f"cleanup::{run_log}"
+
 
-    return f"✅ Deleted {len(deleted)} documents from {doctype}. ❌ Skipped: {len(skipped)}."
+def run_manual_cleanup(run_log):
+    """Background job for `delete_manual_docs`, resumable from the checkpoint on its detail row."""
+    run_log = frappe.get_doc("Cleanup Run Log", run_log)
+    if run_log.status not in ("Queued", "Running"):
+        return
+
+    row = run_log.details[0]
+    docstatus = get_docstatus_filter(row.doc_status)
+    row.status = "Running"
+    row.db_update()
+    run_log.db_set("status", "Running", update_modified=False, commit=True)
+
+    # Counts and duration carried over from earlier attempts of this run
+    previous = frappe._dict(deleted=row.deleted or 0, failed=row.failed or 0, duration=row.duration or 0)
+    total = row.total_documents
+
+    def on_chunk(stats, last_key):
+        row.deleted = previous.deleted + stats.deleted
+        row.failed = previous.failed + stats.failed
+        if last_key:
+            row.last_creation, row.last_name = last_key
+        row.db_update()
+        frappe.db.set_value(
+            "Cleanup Run Log",
+            run_log.name,
+            {"total_deleted": row.deleted, "total_failed": row.failed},
+            update_modified=False,
+        )
+        _publish_progress(run_log.name, "Running", row, total)
+        return frappe.db.get_value("Cleanup Run Log", run_log.name, "status") == "Cancelled"
+
+    try:
+        stats = delete_documents(
+            row.ref_doctype,
+            row.threshold,
+            created_by=row.created_by,
+            docstatus=docstatus,
+            start_after=(row.last_creation, row.last_name) if row.last_name else None,
+            on_chunk=on_chunk,
+        )
+    except Exception:
+        frappe.db.rollback()
+        row.status = "Failed"
+        row.failures = format_failures([{"name": row.ref_doctype, "error": frappe.get_traceback()}], row.failures)
+        run_log.finish("Failed")
+        _publish_progress(run_log.name, "Failed", row, total)
+        raise
+
+    status = "Cancelled" if stats.stopped else "Completed"
+    row.update(
+        {
+            "status": status,
+            "strategy": stats.strategy,
+            "duration": previous.duration + stats.duration,
+            "failures": format_failures(stats.failures, row.failures),
+        }
+    )
+    row.rows_per_second = row.deleted / row.duration if row.duration else 0
+    run_log.finish(status)
+    _publish_progress(run_log.name, status, row, total)
+
+
+def _publish_progress(run_log, status, row, total):
+    frappe.publish_realtime(
+        "cleanup_progress",
+        {
+            "run_log": run_log,
+            "status": status,
+            "deleted": row.deleted,
+            "failed": row.failed,
+            "total": total,
+        },
+        doctype="Cleanup Settings",
+        docname="Cleanup Settings",
+    )
 
 
 @frappe.whitelist()
 def execute():
-    """Scheduled auto-cleanup for documents based on Cleanup Settings config."""
+    """Scheduled auto-cleanup for documents based on Cleanup Settings config.
+
+    Queues one Cleanup Run Log row per enabled Cleanup Document row and fans
+    them out to at most `max_parallel_jobs` lane jobs, which share the run's
+    time budget.
+    """
     settings = frappe.get_single("Cleanup Settings")
 
+    _finish_abandoned_runs()
+
     # ✅ Global enable/disable check
     if not settings.enable_automatic_cleanup:
-        frappe.log_error("Automatic cleanup is disabled in Cleanup Settings.", "Auto Delete Skipped")
         return
 
-    frappe.log_error("Executing Cleanup Settings Scheduler...", "Auto Delete")
-
-    for row in settings.get("cleanup_document_list") or []:
-        if not row.get("enable_schedule"):
-            continue
+    # Everything about this run goes into a single Cleanup Run Log
+    run_log = new_run_log("Scheduled")
+    if cint(settings.time_budget):
+        run_log.deadline = add_to_date(run_log.started_at, minutes=cint(settings.time_budget))
 
+    for row in _rows_in_schedule_order(settings):
         doctype = row.get("ref_doctype")
         days_to_keep = row.get("clear_logs_after")
-        created_by = row.get("created_by")
-        doc_status = row.get("doc_status")
 
         if not doctype or days_to_keep in (None, ""):
-            frappe.log_error(f"Skipping row due to missing doctype or days: {doctype}, {days_to_keep}", "Auto Delete Skipped")
+            run_log.add_result(doctype, status="Skipped", failures="Missing DocType or Clear Logs After")
             continue
 
         try:
             days_to_keep = int(days_to_keep)
         except (ValueError, TypeError):
-            frappe.log_error(f"Invalid clear_logs_after value for {doctype}: {days_to_keep}", "Auto Delete Skipped")
+            run_log.add_result(doctype, status="Skipped", failures=f"Invalid clear_logs_after value: {days_to_keep}")
             continue
 
-        threshold_date = add_days(now_datetime(), -days_to_keep)
-        frappe.log_error(f"Checking {doctype} before {threshold_date}", "Auto Delete")
+        run_log.add_result(
+            doctype,
+            add_days(now_datetime(), -days_to_keep),
+            status="Queued",
+            created_by=row.get("created_by"),
+            doc_status=row.get("doc_status"),
+            max_rows_per_second=row.get("max_rows_per_second"),
+        )
 
-        filters = {
-            "creation": ("<", threshold_date)
-        }
+    queued = sum(1 for row in run_log.details if row.status == "Queued")
+    if not queued:
+        run_log.finish()
+        return
 
-        if created_by:
-            filters["owner"] = created_by
+    run_log.pending_jobs = min(max(cint(settings.max_parallel_jobs), 1), queued)
+    run_log.insert(ignore_permissions=True)
 
-        if doc_status is not None and doc_status != "":
-            filters["docstatus"] = int(doc_status)
+    budget = cint(settings.time_budget) * 60 or LONG_JOB_TIMEOUT
+    for lane in range(run_log.pending_jobs):
+        frappe.enqueue(
+            "validation.validation.doctype.cleanup_settings.cleanup_settings.run_cleanup_lane",
+            queue="long",
+            timeout=budget + LANE_TIMEOUT_MARGIN,
+            job_id=f"{_job_id(run_log.name)}::{lane}",
+            deduplicate=True,
+            enqueue_after_commit=True,
+            run_log=run_log.name,
+        )
 
-        old_docs = frappe.get_all(doctype, filters=filters, pluck="name")
-        frappe.log_error(f"Found {len(old_docs)} old {doctype} records", "Auto Delete")
 
-        for name in old_docs:
-            try:
-                frappe.delete_doc(doctype, name, force=1, ignore_permissions=True)
-                frappe.log_error(f"Deleted {doctype} record: {name}", "Auto Delete Success")
-            except Exception as e:
-                frappe.log_error(f"Failed to delete {doctype} record: {name}. Error: {str(e)}", "Auto Delete Error")
+def _finish_abandoned_runs():
+    """Close scheduled runs whose lanes were killed, e.g. on timeout, before `_finish_lane` ran."""
+    for run in frappe.get_all(
+        "Cleanup Run Log",
+        filters={"run_type": "Scheduled", "status": "Running"},
+        fields=["name", "started_at", "deadline"],
+    ):
+        # Past this point every lane of the run has finished or been killed
+        end = run.deadline or add_to_date(run.started_at, seconds=LONG_JOB_TIMEOUT)
+        if add_to_date(end, seconds=LANE_TIMEOUT_MARGIN) > now_datetime():
+            continue
+
+        run_log = frappe.get_doc("Cleanup Run Log", run.name)
+        for row in run_log.details:
+            if row.status == "Queued":
+                row.status = "Carried Over"
+            elif row.status == "Running":
+                row.status = "Failed"
+                row.failures = format_failures(
+                    [{"name": row.ref_doctype, "error": "Lane job stopped before finishing this row"}], row.failures
+                )
+        run_log.pending_jobs = 0
+        run_log.finish()
+
+
+def _rows_in_schedule_order(settings):
+    """Enabled rows, with DocTypes carried over by the previous night first."""
+    rows = [row for row in settings.get("cleanup_document_list") or [] if row.get("enable_schedule")]
+
+    last_run = frappe.db.get_value("Cleanup Run Log", {"run_type": "Scheduled"}, "name", order_by="creation desc")
+    if not last_run:
+        return rows
+
+    carried_over = set(
+        frappe.get_all(
+            "Cleanup Run Log Detail",
+            filters={"parent": last_run, "parenttype": "Cleanup Run Log", "status": "Carried Over"},
+            pluck="ref_doctype",
+        )
+    )
+    return sorted(rows, key=lambda row: row.get("ref_doctype") not in carried_over)
+
+
+def run_cleanup_lane(run_log):
+    """One of the scheduled run's parallel workers: claims queued rows until none are left."""
+    deadline = frappe.db.get_value("Cleanup Run Log", run_log, "deadline")
+
+    try:
+        while True:
+            if deadline and now_datetime() >= deadline:
+                frappe.db.sql(
+                    """update `tabCleanup Run Log Detail` set status = 'Carried Over'
+                    where parent = %s and status = 'Queued'""",
+                    run_log,
+                )
+                frappe.db.commit()
+                break
+
+            row = _claim_next_row(run_log)
+            if not row:
+                break
+            _run_scheduled_row(run_log, row, deadline)
+    finally:
+        _finish_lane(run_log)
+
+
+def _claim_next_row(run_log):
+    for name in frappe.get_all(
+        "Cleanup Run Log Detail",
+        filters={"parent": run_log, "parenttype": "Cleanup Run Log", "status": "Queued"},
+        order_by="idx",
+        pluck="name",
+    ):
+        # The locking read sees other lanes' claims, so only one lane moves a row out of Queued
+        if frappe.db.get_value("Cleanup Run Log Detail", name, "status", for_update=True) == "Queued":
+            frappe.db.set_value("Cleanup Run Log Detail", name, "status", "Running", update_modified=False)
+            frappe.db.commit()
+            return frappe.db.get_value("Cleanup Run Log Detail", name, "*", as_dict=True)
+        frappe.db.commit()
+
+    return None
+
+
+def _run_scheduled_row(run_log, row, deadline):
+    def on_chunk(stats, last_key):
+        # Committed with the chunk, so the row always counts what is really gone
+        frappe.db.set_value(
+            "Cleanup Run Log Detail",
+            row.name,
+            {"deleted": stats.deleted, "failed": stats.failed},
+            update_modified=False,
+        )
+        return bool(deadline) and now_datetime() >= deadline
+
+    try:
+        stats = delete_documents(
+            row.ref_doctype,
+            row.threshold,
+            created_by=row.created_by,
+            docstatus=get_docstatus_filter(row.doc_status),
+            force=True,
+            ignore_permissions=True,
+            max_rows_per_second=row.max_rows_per_second,
+            on_chunk=on_chunk,
+        )
+    except Exception:
+        # Earlier chunks are already committed; only the current one is lost
+        frappe.db.rollback()
+        frappe.db.set_value(
+            "Cleanup Run Log Detail",
+            row.name,
+            {"status": "Failed", "failures": frappe.get_traceback()},
+            update_modified=False,
+        )
+        deleted, failed = frappe.db.get_value("Cleanup Run Log Detail", row.name, ["deleted", "failed"])
+        _add_run_totals(run_log, deleted or 0, failed or 0)
+        frappe.db.commit()
+        return
+
+    frappe.db.set_value(
+        "Cleanup Run Log Detail",
+        row.name,
+        {
+            "status": "Carried Over" if stats.stopped else "Completed",
+            "strategy": stats.strategy,
+            "deleted": stats.deleted,
+            "failed": stats.failed,
+            "duration": stats.duration,
+            "rows_per_second": stats.rows_per_second,
+            "failures": format_failures(stats.failures),
+        },
+        update_modified=False,
+    )
+    _add_run_totals(run_log, stats.deleted, stats.failed)
+    frappe.db.commit()
+
+
+def _add_run_totals(run_log, deleted, failed):
+    frappe.db.sql(
+        """update `tabCleanup Run Log`
+        set total_deleted = total_deleted + %s, total_failed = total_failed + %s
+        where name = %s""",
+        (deleted, failed, run_log),
+    )
+
+
+def _finish_lane(run_log):
+    # The locking read makes the decrements strictly ordered, so exactly one lane sees zero
+    pending = frappe.db.sql("select pending_jobs from `tabCleanup Run Log` where name = %s for update", run_log)[0][0]
+    frappe.db.set_value("Cleanup Run Log", run_log, "pending_jobs", pending - 1, update_modified=False)
+    frappe.db.commit()
+
+    if pending - 1 <= 0:
+        frappe.get_doc("Cleanup Run Log", run_log).finish()
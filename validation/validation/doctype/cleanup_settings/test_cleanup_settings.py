@@ -1,9 +1,122 @@
 # Copyright (c) 2025, Ameer Babu and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_to_date, get_datetime
+
+from validation.validation.doctype.cleanup_run_log.cleanup_run_log import new_run_log
+from validation.validation.doctype.cleanup_settings.cleanup_settings import (
+	_finish_abandoned_runs,
+	delete_documents,
+	get_cleanup_index_columns,
+	get_docstatus_filter,
+	preview_cleanup,
+	run_cleanup_lane,
+	run_manual_cleanup,
+)
+
+
+# Far older than any real ToDo, so the cleanups below only ever match test records
+OLD_CREATION = get_datetime("2000-01-01 00:00:00")
+THRESHOLD = get_datetime("2000-02-01 00:00:00")
 
 
 class TestCleanupSettings(FrappeTestCase):
-	pass
+	def test_docstatus_labels(self):
+		self.assertIsNone(get_docstatus_filter("All"))
+		self.assertIsNone(get_docstatus_filter(""))
+		self.assertEqual(get_docstatus_filter("Draft"), 0)
+		self.assertEqual(get_docstatus_filter("Cancelled"), 2)
+
+	def test_index_columns_put_equality_filters_first(self):
+		self.assertEqual(get_cleanup_index_columns(), ["creation"])
+		self.assertEqual(
+			get_cleanup_index_columns("test@example.com", "Draft"), ["owner", "docstatus", "creation"]
+		)
+		self.assertEqual(get_cleanup_index_columns(docstatus="All"), ["creation"])
+
+	def test_preview_counts_matching_rows(self):
+		self.make_old_todos(2)
+
+		preview = preview_cleanup("ToDo", THRESHOLD, created_by=frappe.session.user)
+
+		self.assertGreaterEqual(preview["exact_count"], 2)
+		self.assertEqual(preview["strategy"], "Per Document")
+
+	def make_old_todos(self, count):
+		"""ToDos with ascending creation, so names[0] is also first in (creation, name) order."""
+		marker = frappe.generate_hash(length=8)
+		names = []
+		for i in range(count):
+			todo = frappe.get_doc({"doctype": "ToDo", "description": f"_Test Cleanup {marker} {i}"}).insert()
+			creation = add_to_date(OLD_CREATION, seconds=i)
+			frappe.db.set_value("ToDo", todo.name, "creation", creation, update_modified=False)
+			names.append(todo.name)
+		return names
+
+	def test_delete_documents_pages_through_chunks(self):
+		names = self.make_old_todos(5)
+
+		stats = delete_documents("ToDo", THRESHOLD, created_by=frappe.session.user, chunk_size=2)
+
+		self.assertGreaterEqual(stats.deleted, 5)
+		self.assertGreaterEqual(stats.chunks, 3)
+		self.assertFalse(frappe.get_all("ToDo", filters={"name": ["in", names]}))
+
+	def test_manual_cleanup_resumes_from_checkpoint(self):
+		names = self.make_old_todos(3)
+		first = frappe.db.get_value("ToDo", names[0], ["creation", "name"])
+
+		run_log = new_run_log("Manual")
+		run_log.status = "Queued"
+		run_log.add_result(
+			"ToDo",
+			THRESHOLD,
+			status="Queued",
+			created_by=frappe.session.user,
+			last_creation=first[0],
+			last_name=first[1],
+		)
+		run_log.insert(ignore_permissions=True)
+
+		run_manual_cleanup(run_log.name)
+
+		run_log.reload()
+		self.assertEqual(run_log.status, "Completed")
+		# Everything up to the checkpoint is treated as already handled
+		self.assertTrue(frappe.db.exists("ToDo", names[0]))
+		self.assertFalse(frappe.get_all("ToDo", filters={"name": ["in", names[1:]]}))
+
+	def test_last_lane_finishes_scheduled_run(self):
+		names = self.make_old_todos(2)
+
+		run_log = new_run_log("Scheduled")
+		run_log.pending_jobs = 1
+		run_log.add_result("ToDo", THRESHOLD, status="Queued", created_by=frappe.session.user)
+		run_log.add_result("ToDo", status="Skipped", failures="Invalid clear_logs_after value: x")
+		run_log.insert(ignore_permissions=True)
+
+		run_cleanup_lane(run_log.name)
+
+		run_log.reload()
+		self.assertEqual(run_log.status, "Completed")
+		self.assertEqual(run_log.details[0].status, "Completed")
+		self.assertGreaterEqual(run_log.total_deleted, 2)
+		self.assertFalse(frappe.get_all("ToDo", filters={"name": ["in", names]}))
+
+	def test_next_execute_finishes_runs_with_killed_lanes(self):
+		run_log = new_run_log("Scheduled")
+		run_log.started_at = add_to_date(OLD_CREATION, hours=-1)
+		run_log.deadline = OLD_CREATION
+		run_log.pending_jobs = 1
+		run_log.add_result("ToDo", THRESHOLD, status="Running")
+		run_log.add_result("Comment", THRESHOLD, status="Queued")
+		run_log.insert(ignore_permissions=True)
+
+		_finish_abandoned_runs()
+
+		run_log.reload()
+		self.assertEqual(run_log.status, "Failed")
+		self.assertEqual(run_log.pending_jobs, 0)
+		self.assertEqual([row.status for row in run_log.details], ["Failed", "Carried Over"])
@@ -5,5 +5,5 @@
 from frappe.model.document import Document
 
 
-class Dictionary(Document):
+class DictionaryDocType(Document):
 	pass
@@ -0,0 +1,162 @@
+# Copyright (c) 2025, Ameer Babu and contributors
+# For license information, please see license.txt
+
+from datetime import timedelta
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_days, get_datetime, getdate, now_datetime
+
+WATERMARK_KEY = "document_time_rollup_watermark"
+
+# Activity logged this recently may still sit in uncommitted transactions
+COMMIT_LAG = timedelta(minutes=5)
+
+ROLLUP_FIELDS = (
+	"date",
+	"user",
+	"reference_doctype",
+	"reference_name",
+	"session_minutes",
+	"first_access",
+	"last_access",
+	"event_count",
+)
+
+
+class DocumentTimeRollup(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_unique(
+		"Document Time Rollup",
+		["date", "user", "reference_doctype", "reference_name"],
+		constraint_name="unique_rollup_key",
+	)
+
+
+def get_rollup_watermark():
+	"""Creation time up to which activity has been rolled up, or None if the rollup was never built."""
+	watermark = frappe.db.get_global(WATERMARK_KEY)
+	return get_datetime(watermark) if watermark else None
+
+
+def update_rollup():
+	"""Fold activity newer than the watermark into the rollup, one calendar day per transaction.
+
+	Each day gets one row per (user, DocType, document) and one DocType-wide row
+	with an empty reference_name, as the consolidated view merges sessions
+	across documents.
+	"""
+	from validation.validation.report.document_time_tracking.document_time_tracking import (
+		SessionAccumulator,
+		iter_activity,
+	)
+
+	until = now_datetime() - COMMIT_LAG
+	watermark = get_rollup_watermark() or _before_first_activity()
+	if not watermark:
+		return
+
+	while watermark < until:
+		window_end = min(get_datetime(add_days(getdate(watermark), 1)), until)
+
+		sessions = SessionAccumulator()
+		for _source, user, doctype, docname, creation in iter_activity({}, after=watermark, until=window_end):
+			day = creation.date()
+			sessions.add((day, user, doctype, docname), creation)
+			sessions.add((day, user, doctype, ""), creation)
+
+		_merge_into_rollup(sessions)
+		frappe.db.set_global(WATERMARK_KEY, str(window_end))
+		frappe.db.commit()
+		watermark = window_end
+
+
+def merge_session(row, first, last, minutes, events):
+	"""Extend a stored day total with later activity of the same key.
+
+	`minutes` covers only the new activity, without the tail credited to its
+	last event. The tail already in `row` then stands for that last event.
+	"""
+	from validation.validation.report.document_time_tracking.document_time_tracking import (
+		SESSION_TAIL_MINUTES,
+		SESSION_TIMEOUT,
+	)
+
+	gap = first - get_datetime(row.last_access)
+	bridge = gap.total_seconds() / 60 if gap <= SESSION_TIMEOUT else SESSION_TAIL_MINUTES
+	return {
+		"session_minutes": row.session_minutes + bridge + minutes,
+		"last_access": last,
+		"event_count": row.event_count + events,
+	}
+
+
+def _merge_into_rollup(sessions):
+	from validation.validation.report.document_time_tracking.document_time_tracking import (
+		SESSION_TAIL_MINUTES,
+	)
+
+	if not sessions.sessions:
+		return
+
+	dates = list({key[0] for key in sessions.sessions})
+	existing = {
+		(row.date, row.user, row.reference_doctype, row.reference_name): row
+		for row in frappe.get_all(
+			"Document Time Rollup", filters={"date": ["in", dates]}, fields=["name", *ROLLUP_FIELDS]
+		)
+	}
+
+	now = now_datetime()
+	new_rows = []
+	for key, (first, last, minutes, events) in sessions.items(tail=False):
+		row = existing.get(key)
+		if row:
+			frappe.db.set_value(
+				"Document Time Rollup",
+				row.name,
+				merge_session(row, first, last, minutes, events),
+				update_modified=False,
+			)
+		else:
+			new_rows.append(
+				(
+					frappe.generate_hash(length=10),
+					now,
+					now,
+					"Administrator",
+					"Administrator",
+					*key,
+					minutes + SESSION_TAIL_MINUTES,
+					first,
+					last,
+					events,
+				)
+			)
+
+	if new_rows:
+		frappe.db.bulk_insert(
+			"Document Time Rollup",
+			["name", "creation", "modified", "owner", "modified_by", *ROLLUP_FIELDS],
+			new_rows,
+		)
+
+
+def _before_first_activity():
+	first = min(
+		(
+			value
+			for value in (
+				frappe.db.sql("select min(creation) from `tabActivity Log`")[0][0],
+				frappe.db.sql("select min(creation) from `tabVersion`")[0][0],
+				frappe.db.sql("select min(creation) from `tabRoute History`")[0][0],
+			)
+			if value
+		),
+		default=None,
+	)
+	# iter_activity only returns rows strictly after the watermark
+	return first - timedelta(microseconds=1) if first else None
@@ -0,0 +1,28 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+from datetime import datetime
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.doctype.document_time_rollup.document_time_rollup import merge_session
+from validation.validation.report.document_time_tracking.document_time_tracking import calculate_time_spent
+
+
+class TestDocumentTimeRollup(FrappeTestCase):
+	def test_merge_matches_a_single_pass(self):
+		earlier = [datetime(2025, 1, 1, 9, 0), datetime(2025, 1, 1, 9, 10)]
+		later = [datetime(2025, 1, 1, 9, 25), datetime(2025, 1, 1, 11, 0), datetime(2025, 1, 1, 11, 5)]
+
+		row = frappe._dict(
+			session_minutes=calculate_time_spent(earlier), last_access=earlier[-1], event_count=len(earlier)
+		)
+		# Minutes of the later activity on its own, without the tail of its last event
+		later_minutes = calculate_time_spent(later) - 2
+
+		merged = merge_session(row, later[0], later[-1], later_minutes, len(later))
+
+		self.assertAlmostEqual(merged["session_minutes"], calculate_time_spent(earlier + later))
+		self.assertEqual(merged["event_count"], 5)
+		self.assertEqual(merged["last_access"], later[-1])
@@ -0,0 +1,126 @@
+# Copyright (c) 2025, Ameer Babu and contributors
+# For license information, please see license.txt
+
+import re
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import cint, now
+
+# Item codes look like "<group abbreviation> - 001"
+ITEM_CODE_PATTERN = re.compile(r"^(?P<abbr>.+) - (?P<number>\d+)$")
+
+# Item groups whose items get generated codes, directly or as their parent
+AUTOMATED_ITEM_GROUPS = ("Selling Items", "Buying Items")
+EXCLUDED_ITEM_GROUPS = ("Packing Materials",)
+
+# Upper bound for one reserve_item_codes call
+MAX_RESERVATION = 10000
+
+
+class ItemCodeSequence(Document):
+	pass
+
+
+def format_item_code(abbr, number):
+	return f"{abbr} - {number:03d}"
+
+
+def allocate_item_codes(abbr, count=1):
+	"""Hand out the next `count` item codes for `abbr` with a single atomic increment.
+
+	The sequence row stays locked until the transaction commits, so concurrent
+	callers never get the same codes and a rollback gives them back.
+	"""
+	ensure_sequence(abbr)
+	frappe.db.sql(
+		"""update `tabItem Code Sequence`
+		set current_value = last_insert_id(current_value + %s)
+		where name = %s""",
+		(count, abbr),
+	)
+	last = frappe.db.sql("select last_insert_id()")[0][0]
+	return [format_item_code(abbr, number) for number in range(last - count + 1, last + 1)]
+
+
+def ensure_sequence(abbr):
+	"""Create the counter for `abbr`, starting after the highest code already in use."""
+	if frappe.db.exists("Item Code Sequence", abbr):
+		return
+
+	now_value = now()
+	frappe.db.sql(
+		"""insert ignore into `tabItem Code Sequence`
+		(name, abbr, current_value, creation, modified, owner, modified_by)
+		values (%s, %s, %s, %s, %s, %s, %s)""",
+		(abbr, abbr, get_highest_item_code_number(abbr), now_value, now_value, frappe.session.user, frappe.session.user),
+	)
+
+
+def get_highest_item_code_number(abbr):
+	"""Highest number among existing item codes for `abbr`, compared as numbers, not text."""
+	highest = 0
+	# Wildcards in `abbr` only widen the LIKE; the pattern match below is exact
+	for item_code in frappe.db.sql_list("select item_code from `tabItem` where item_code like %s", f"{abbr} - %"):
+		match = ITEM_CODE_PATTERN.match(item_code)
+		if match and match.group("abbr") == abbr:
+			highest = max(highest, int(match.group("number")))
+	return highest
+
+
+def is_automated_item_group(item_group):
+	if not item_group or item_group in EXCLUDED_ITEM_GROUPS:
+		return False
+	if item_group in AUTOMATED_ITEM_GROUPS:
+		return True
+	return frappe.get_cached_value("Item Group", item_group, "parent_item_group") in AUTOMATED_ITEM_GROUPS
+
+
+def set_item_code(doc, method=None):
+	"""Item before_insert: give items of automated groups the next code for their group.
+
+	Codes reserved earlier through reserve_item_codes are kept; anything else,
+	including the preview shown on the form, is replaced by a freshly allocated code.
+	"""
+	if not is_automated_item_group(doc.item_group):
+		return
+
+	# custom_group_abbr is fetched from the group only in validate, e.g. for imported items
+	abbr = doc.get("custom_group_abbr") or frappe.get_cached_value(
+		"Item Group", doc.item_group, "custom_group_abbreviation"
+	)
+	if not abbr:
+		return
+
+	match = ITEM_CODE_PATTERN.match(doc.item_code or "")
+	if match and match.group("abbr") == abbr:
+		current = frappe.db.get_value("Item Code Sequence", abbr, "current_value")
+		if current is not None and int(match.group("number")) <= current:
+			return
+
+	doc.item_code = allocate_item_codes(abbr)[0]
+
+
+@frappe.whitelist()
+def get_next_item_code(abbr):
+	"""Preview of the code the next item for `abbr` will get; nothing is reserved."""
+	if not abbr:
+		return None
+
+	current = frappe.db.get_value("Item Code Sequence", abbr, "current_value")
+	if current is None:
+		current = get_highest_item_code_number(abbr)
+	return format_item_code(abbr, current + 1)
+
+
+@frappe.whitelist()
+def reserve_item_codes(abbr, count=1):
+	"""Reserve a block of item codes for `abbr`, e.g. to fill in a bulk import file."""
+	frappe.has_permission("Item", "create", throw=True)
+
+	count = cint(count)
+	if not abbr or not 0 < count <= MAX_RESERVATION:
+		frappe.throw(_("Select an abbreviation and between 1 and {0} codes").format(MAX_RESERVATION))
+
+	return allocate_item_codes(abbr, count)
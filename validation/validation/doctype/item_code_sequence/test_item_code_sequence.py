@@ -0,0 +1,24 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.doctype.item_code_sequence.item_code_sequence import (
+	allocate_item_codes,
+	get_next_item_code,
+)
+
+
+class TestItemCodeSequence(FrappeTestCase):
+	def test_allocation_is_sequential_and_numeric(self):
+		abbr = "_TICS"
+		frappe.delete_doc_if_exists("Item Code Sequence", abbr)
+
+		self.assertEqual(get_next_item_code(abbr), "_TICS - 001")
+		self.assertEqual(allocate_item_codes(abbr), ["_TICS - 001"])
+		self.assertEqual(allocate_item_codes(abbr, 3), ["_TICS - 002", "_TICS - 003", "_TICS - 004"])
+
+		frappe.db.set_value("Item Code Sequence", abbr, "current_value", 999)
+		self.assertEqual(allocate_item_codes(abbr), ["_TICS - 1000"])
+		self.assertEqual(get_next_item_code(abbr), "_TICS - 1001")
@@ -0,0 +1,155 @@
+# Copyright (c) 2025, Ameer Babu and contributors
+# For license information, please see license.txt
+
+import csv
+import json
+import re
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import now
+
+FIELDS = ("pincode", "post_office", "taluk", "district", "state")
+
+# Column names used by the India Post open data dump and the postalpincode.in API
+COLUMN_ALIASES = {
+	"pincode": ("pincode",),
+	"post_office": ("post_office", "officename", "office_name", "name"),
+	"taluk": ("taluk", "block"),
+	"district": ("district", "districtname"),
+	"state": ("state", "statename"),
+}
+
+# India Post suffixes office names with their type, e.g. "Kakkanad S.O"
+OFFICE_TYPE_SUFFIX = re.compile(r"\s+[BHS]\.?O\.?$", flags=re.IGNORECASE)
+
+IMPORT_CHUNK_SIZE = 5000
+
+
+class PincodePostOffice(Document):
+	def on_update(self):
+		self.clear_post_office_cache()
+
+	def on_trash(self):
+		self.clear_post_office_cache()
+
+	def clear_post_office_cache(self):
+		from validation.customization import address
+
+		address.clear_post_office_cache(self.pincode)
+
+
+def get_post_offices(pincode):
+	"""Return the post offices stored locally for `pincode`, in the shape of the remote API."""
+	return frappe.get_all(
+		"Pincode Post Office",
+		filters={"pincode": pincode},
+		fields=list(FIELDS[1:]),
+		order_by="post_office",
+	)
+
+
+def save_post_offices(pincode, offices):
+	"""Store offices fetched from the remote API so the next lookup stays local."""
+	insert_post_offices([dict(office, pincode=pincode) for office in offices])
+
+
+def insert_post_offices(rows):
+	"""Bulk insert post office rows, silently skipping ones already in the directory."""
+	timestamp = now()
+	user = frappe.session.user
+	values = []
+
+	for row in rows:
+		pincode = str(row.get("pincode") or "").strip()
+		post_office = OFFICE_TYPE_SUFFIX.sub("", str(row.get("post_office") or "").strip())
+		if not pincode or not post_office:
+			continue
+
+		values.append((
+			f"{pincode}-{post_office}",
+			pincode,
+			post_office,
+			(row.get("taluk") or "").strip(),
+			(row.get("district") or "").strip(),
+			(row.get("state") or "").strip(),
+			timestamp,
+			timestamp,
+			user,
+			user,
+		))
+
+	if values:
+		frappe.db.bulk_insert(
+			"Pincode Post Office",
+			fields=["name", *FIELDS, "creation", "modified", "owner", "modified_by"],
+			values=values,
+			ignore_duplicates=True,
+		)
+
+	return len(values)
+
+
+@frappe.whitelist()
+def import_post_offices(file_url):
+	"""Load a CSV or JSON dump attached as a File into the local directory in the background."""
+	frappe.only_for("System Manager")
+
+	file_path = frappe.get_doc("File", {"file_url": file_url}).get_full_path()
+	frappe.enqueue(load_post_offices, queue="long", timeout=3600, file_path=file_path)
+
+	return _("Pincode import has been queued.")
+
+
+def load_post_offices(file_path):
+	"""Read a CSV or JSON dump and insert it in chunks, committing after each chunk."""
+	total = 0
+	chunk = []
+
+	for row in _read_dump(file_path):
+		chunk.append(row)
+		if len(chunk) >= IMPORT_CHUNK_SIZE:
+			total += _import_chunk(chunk)
+			chunk = []
+
+	total += _import_chunk(chunk)
+
+	return total
+
+
+def _import_chunk(rows):
+	from validation.customization.address import clear_post_office_caches
+
+	inserted = insert_post_offices(rows)
+	frappe.db.commit()
+	# Earlier lookups may have cached these pincodes as unknown
+	clear_post_office_caches({str(row.get("pincode") or "").strip() for row in rows} - {""})
+	return inserted
+
+
+def _read_dump(file_path):
+	with open(file_path, encoding="utf-8-sig") as f:
+		if file_path.lower().endswith(".json"):
+			records = json.load(f)
+			# Saved postalpincode.in responses wrap offices in [{"PostOffice": [...]}]
+			if records and isinstance(records[0], dict) and "PostOffice" in records[0]:
+				records = [po for response in records for po in (response.get("PostOffice") or [])]
+		else:
+			records = csv.DictReader(f)
+
+		for record in records:
+			yield _normalize_record(record)
+
+
+def _normalize_record(record):
+	record = {str(key).strip().lower(): value for key, value in record.items()}
+	row = {}
+
+	for field, aliases in COLUMN_ALIASES.items():
+		for alias in aliases:
+			if record.get(alias):
+				row[field] = str(record[alias])
+				break
+
+	return row
@@ -0,0 +1,18 @@
+frappe.listview_settings["Pincode Post Office"] = {
+    onload(listview) {
+        if (!frappe.user.has_role("System Manager")) return;
+
+        listview.page.add_inner_button(__("Import Dump"), () => {
+            new frappe.ui.FileUploader({
+                restrictions: { allowed_file_types: [".csv", ".json"] },
+                on_success(file) {
+                    frappe.call({
+                        method: "validation.validation.doctype.pincode_post_office.pincode_post_office.import_post_offices",
+                        args: { file_url: file.file_url },
+                        callback: r => frappe.show_alert(r.message)
+                    });
+                }
+            });
+        });
+    }
+};
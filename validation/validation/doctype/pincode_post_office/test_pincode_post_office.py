@@ -0,0 +1,22 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+# import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.doctype.pincode_post_office.pincode_post_office import (
+	get_post_offices,
+	insert_post_offices,
+)
+
+
+class TestPincodePostOffice(FrappeTestCase):
+	def test_insert_and_lookup(self):
+		row = {"pincode": "999001", "post_office": "Test Nagar S.O", "taluk": "Test", "state": "Kerala"}
+		insert_post_offices([row, row])
+
+		offices = get_post_offices("999001")
+
+		self.assertEqual(len(offices), 1)
+		self.assertEqual(offices[0].post_office, "Test Nagar")
+		self.assertEqual(offices[0].taluk, "Test")
@@ -3,67 +3,254 @@
 import frappe
 import re
 from frappe.model.document import Document
+from frappe.utils import cstr
+
+
+DICTIONARY_VERSION_KEY = "private_dictionary_version"
+DICTIONARY_SCOPE_KEY = "private_dictionary_scope"
+REPLACEMENT_PLAN_KEY = "private_dictionary_replacement_plan"
+
+ENTRY_DOCTYPE = "Private Dictionary Entry"
+
+TEXT_FIELD_TYPES = ('Data', 'Small Text', 'Text', 'Long Text', 'Text Editor')
+
+# Written by the framework and background jobs, never typed into by users
+SKIPPED_DOCTYPES = frozenset({
+    "Access Log",
+    "Activity Log",
+    "Comment",
+    "Data Import Log",
+    "Deleted Document",
+    "Email Queue",
+    "Error Log",
+    "Integration Request",
+    "Notification Log",
+    "Prepared Report",
+    "Private Dictionary",
+    "Private Dictionary Entry",
+    "Route History",
+    "Scheduled Job Log",
+    "Settings for Automation",
+    "Submission Queue",
+    "Version",
+    "View Log",
+})
+
+# Compiled matchers shared by every request served by this process,
+# keyed by site so that multi-site benches never mix dictionaries.
+_matchers = {}
 
 
 class PrivateDictionary(Document):
     pass
 
 
-def apply_private_dictionary(value):
-    dictionary_doc = frappe.get_single('Private Dictionary')
-    replace_map = {}
-    replacements_made = {}
+class DictionaryMatcher:
+    """Replaces every dictionary entry in a single pass over the text.
+
+    All originals are folded into one regex built from a character trie, so
+    matching cost depends on the length of the text rather than on the number
+    of dictionary entries. Longer entries win over their prefixes.
+    """
 
-    for row in dictionary_doc.dictionary:
-        if row.original_name and row.suggested_name:
-            replace_map[row.original_name] = row.suggested_name
+    def __init__(self, replace_map):
+        self.lookup = {}
+        for original, suggested in replace_map.items():
+            self.lookup[original.lower()] = (original, suggested)
 
-    for original, suggested in replace_map.items():
-        pattern = r'\b' + re.escape(original) + r'\b'
-        if re.search(pattern, value, flags=re.IGNORECASE):
-            value = re.sub(pattern, suggested, value, flags=re.IGNORECASE)
+        trie = {}
+        for key in self.lookup:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        self.pattern = re.compile(r"\b(?:" + _trie_to_pattern(trie) + r")\b", flags=re.IGNORECASE)
+
+    def replace(self, value):
+        replacements_made = {}
+
+        def substitute(match):
+            entry = self.lookup.get(match.group(0).lower())
+            if not entry:
+                return match.group(0)
+
+            original, suggested = entry
             replacements_made[suggested] = original  # Track replacements
+            return suggested
 
-    return value, replacements_made
+        return self.pattern.sub(substitute, value), replacements_made
 
 
-def global_validate_replacement(doc, method):
-    text_field_types = ['Data', 'Small Text', 'Text', 'Long Text', 'Text Editor']
+def _trie_to_pattern(node):
+    """Turn a character trie into an alternation regex without redundant prefixes."""
+    branches = [re.escape(char) + _trie_to_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A shorter entry ends here; the greedy `?` still prefers the longer one
+        pattern = "(?:" + pattern + ")?"
+    return pattern
+
+
+def clear_dictionary_cache():
+    frappe.cache().delete_value(DICTIONARY_VERSION_KEY)
+
+
+def get_original_key(original):
+    """Entries match case-insensitively, so originals differing only in case are one entry."""
+    return cstr(original).strip().lower()
+
+
+def get_dictionary_matcher():
+    """Return the compiled matcher for the current dictionary version, or None if it is empty."""
+    version = frappe.cache().get_value(DICTIONARY_VERSION_KEY)
+    if not version:
+        version = frappe.generate_hash(length=12)
+        frappe.cache().set_value(DICTIONARY_VERSION_KEY, version)
+
+    cached = _matchers.get(frappe.local.site)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    matcher = _build_matcher()
+    _matchers[frappe.local.site] = (version, matcher)
+    return matcher
+
+
+def _build_matcher():
+    # Only the two columns the matcher needs, not whole documents
+    replace_map = dict(frappe.db.sql(
+        "select original_name, suggested_name from `tabPrivate Dictionary Entry`"
+        " where ifnull(original_name, '') != '' and ifnull(suggested_name, '') != ''"
+    ))
+
+    return DictionaryMatcher(replace_map) if replace_map else None
+
+
+def apply_private_dictionary(value, matcher=None):
+    matcher = matcher or get_dictionary_matcher()
+    if not matcher:
+        return value, {}
 
+    return matcher.replace(value)
+
+
+def clear_replacement_plans(doc=None, method=None):
+    """Doc event for DocType, Custom Field and Property Setter changes."""
+    # Drop plans only after commit so no worker rebuilds them from stale meta
+    frappe.db.after_commit.add(_drop_replacement_plans)
+
+
+def _drop_replacement_plans():
+    frappe.cache().delete_value([DICTIONARY_SCOPE_KEY, REPLACEMENT_PLAN_KEY])
+
+
+def get_dictionary_scope():
+    return frappe.cache().get_value(DICTIONARY_SCOPE_KEY, _build_dictionary_scope)
+
+
+def _build_dictionary_scope():
+    settings = frappe.get_single("Settings for Automation")
+    return {
+        "allowed": frozenset(row.dictionary_doctype for row in settings.dictionary_doctypes),
+        "excluded": frozenset(row.dictionary_doctype for row in settings.dictionary_excluded_doctypes)
+        | SKIPPED_DOCTYPES,
+    }
+
+
+def get_replacement_plan(doctype):
+    """Return the text fields of `doctype` (and of its child tables) the dictionary applies to.
+
+    Returns None for DocTypes outside the scope configured in Settings for Automation.
+    """
+    scope = get_dictionary_scope()
+    if doctype in scope["excluded"] or (scope["allowed"] and doctype not in scope["allowed"]):
+        return None
+
+    return frappe.cache().hget(REPLACEMENT_PLAN_KEY, doctype, generator=lambda: _build_replacement_plan(doctype))
+
+
+def _build_replacement_plan(doctype):
+    meta = frappe.get_meta(doctype)
+    plan = {
+        "fields": [df.fieldname for df in meta.fields if df.fieldtype in TEXT_FIELD_TYPES],
+        "tables": {},
+    }
+
+    for df in meta.get_table_fields():
+        if df.fieldtype != "Table":
+            continue
+        child_fields = [
+            child_df.fieldname for child_df in frappe.get_meta(df.options).fields
+            if child_df.fieldtype in TEXT_FIELD_TYPES
+        ]
+        if child_fields:
+            plan["tables"][df.fieldname] = child_fields
+
+    return plan
+
+
+def global_validate_replacement(doc, method):
     doc._auto_replacements = []
 
-    for field in doc.meta.fields:
-        if field.fieldtype in text_field_types:
-            val = doc.get(field.fieldname)
-            if val and isinstance(val, str):
-                new_val, replacements = apply_private_dictionary(val)
-                if new_val != val:
-                    doc.set(field.fieldname, new_val)
-                    doc._auto_replacements.append({
-                        "fieldname": field.fieldname,
-                        "original_value": val,
-                        "corrected_value": new_val,
-                        "replacements": replacements
-                    })
+    plan = get_replacement_plan(doc.doctype)
+    if not plan or not (plan["fields"] or plan["tables"]):
+        return
+
+    matcher = get_dictionary_matcher()
+    if not matcher:
+        return
+
+    _replace_fields(doc, plan["fields"], matcher, doc._auto_replacements)
+
+    for tablefield, fieldnames in plan["tables"].items():
+        for row in doc.get(tablefield) or []:
+            _replace_fields(row, fieldnames, matcher, doc._auto_replacements, tablefield)
+
+
+def _replace_fields(doc, fieldnames, matcher, auto_replacements, parentfield=None):
+    for fieldname in fieldnames:
+        val = doc.get(fieldname)
+        if val and isinstance(val, str):
+            new_val, replacements = apply_private_dictionary(val, matcher)
+            if new_val != val:
+                doc.set(fieldname, new_val)
+                change = {
+                    "fieldname": fieldname,
+                    "original_value": val,
+                    "corrected_value": new_val,
+                    "replacements": replacements
+                }
+                if parentfield:
+                    change.update({"parentfield": parentfield, "idx": doc.idx})
+                auto_replacements.append(change)
 
 @frappe.whitelist()
 def add_to_dictionary(original, corrected):
+    original, corrected = cstr(original).strip(), cstr(corrected).strip()
     if not original or not corrected:
         frappe.throw("Original and corrected words are required.")
 
-    dictionary_doc = frappe.get_single('Private Dictionary')
-    
-    # Check if entry already exists in child table `dictionary`
-    for row in dictionary_doc.dictionary:
-        if row.original_name == original and row.suggested_name == corrected:
+    # One lookup on the unique original_key index, whatever the dictionary size
+    existing = frappe.db.get_value(ENTRY_DOCTYPE, {"original_key": get_original_key(original)})
+    if existing:
+        entry = frappe.get_doc(ENTRY_DOCTYPE, existing)
+        if entry.suggested_name == corrected:
             return "Already exists."
 
-    # Append new child row
-    dictionary_doc.append("dictionary", {
+        entry.suggested_name = corrected
+        entry.save(ignore_permissions=True)
+        return "Updated"
+
+    # on_update invalidates the compiled matcher for every worker
+    frappe.get_doc({
+        "doctype": ENTRY_DOCTYPE,
         "original_name": original,
         "suggested_name": corrected
-    })
-    dictionary_doc.save(ignore_permissions=True)
+    }).insert(ignore_permissions=True)
 
     return "Inserted"
 
@@ -4,6 +4,35 @@
 # import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from validation.validation.doctype.private_dictionary.private_dictionary import (
+	DictionaryMatcher,
+	get_replacement_plan,
+)
+
 
 class TestPrivateDictionary(FrappeTestCase):
-	pass
+	def test_matcher_replaces_whole_words_case_insensitively(self):
+		matcher = DictionaryMatcher({"jhon": "John"})
+
+		value, replacements = matcher.replace("JHON met jhonny")
+
+		self.assertEqual(value, "John met jhonny")
+		self.assertEqual(replacements, {"John": "jhon"})
+
+	def test_matcher_prefers_longest_entry(self):
+		matcher = DictionaryMatcher({"new": "Neu", "new delhi": "New Delhi"})
+
+		value, _ = matcher.replace("new delhi and new york")
+
+		self.assertEqual(value, "New Delhi and Neu york")
+
+	def test_matcher_escapes_special_characters(self):
+		matcher = DictionaryMatcher({"pvt. ltd": "Pvt Ltd"})
+
+		value, _ = matcher.replace("Acme pvt. ltd and pvtX ltd")
+
+		self.assertEqual(value, "Acme Pvt Ltd and pvtX ltd")
+
+	def test_replacement_plan_skips_log_doctypes(self):
+		self.assertIsNone(get_replacement_plan("Error Log"))
+		self.assertIn("description", get_replacement_plan("ToDo")["fields"])
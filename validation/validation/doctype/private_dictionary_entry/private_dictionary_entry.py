@@ -0,0 +1,26 @@
+# Copyright (c) 2025, Ameer Babu and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cstr
+
+from validation.validation.doctype.private_dictionary.private_dictionary import (
+	clear_dictionary_cache,
+	get_original_key,
+)
+
+
+class PrivateDictionaryEntry(Document):
+	def validate(self):
+		self.original_name = cstr(self.original_name).strip()
+		self.suggested_name = cstr(self.suggested_name).strip()
+		self.original_key = get_original_key(self.original_name)
+
+	def on_update(self):
+		# Other workers must only rebuild once the change is visible to them
+		frappe.db.after_commit.add(clear_dictionary_cache)
+
+	def on_trash(self):
+		frappe.db.after_commit.add(clear_dictionary_cache)
+
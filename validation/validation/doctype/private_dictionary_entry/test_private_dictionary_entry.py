@@ -0,0 +1,32 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.doctype.private_dictionary.private_dictionary import add_to_dictionary
+
+
+class TestPrivateDictionaryEntry(FrappeTestCase):
+	def test_add_to_dictionary_upserts_by_original(self):
+		frappe.db.delete("Private Dictionary Entry", {"original_key": "_tpde jhon"})
+
+		self.assertEqual(add_to_dictionary("_TPDE Jhon", "_TPDE John"), "Inserted")
+		self.assertEqual(add_to_dictionary("_tpde jhon", "_TPDE John"), "Already exists.")
+		self.assertEqual(add_to_dictionary(" _TPDE JHON ", "_TPDE Johnny"), "Updated")
+
+		entries = frappe.get_all(
+			"Private Dictionary Entry", filters={"original_key": "_tpde jhon"}, pluck="suggested_name"
+		)
+		self.assertEqual(entries, ["_TPDE Johnny"])
+
+	def test_original_key_is_unique(self):
+		frappe.db.delete("Private Dictionary Entry", {"original_key": "_tpde colour"})
+		frappe.get_doc({
+			"doctype": "Private Dictionary Entry", "original_name": "_TPDE colour", "suggested_name": "_TPDE Color"
+		}).insert()
+
+		with self.assertRaises(frappe.UniqueValidationError):
+			frappe.get_doc({
+				"doctype": "Private Dictionary Entry", "original_name": "_tpde COLOUR", "suggested_name": "_TPDE Colour"
+			}).insert()
@@ -17,4 +17,17 @@ frappe.ui.form.on("Settings for Automation", {
             frm.set_value('enable_customer_automation', 1);
         }
     },
+    refresh(frm) {
+        frm.add_custom_button(__('Normalize Existing Records'), () => {
+            frappe.confirm(
+                __('Reformat the names of all existing records of the DocTypes enabled here?'),
+                () => frappe.call({
+                    method: 'validation.customization.text_formatter.enqueue_renormalization',
+                    callback: (r) => frappe.show_alert(r.message.length
+                        ? {message: __('Normalization queued for {0}', [r.message.join(', ')]), indicator: 'blue'}
+                        : {message: __('No DocType has normalization enabled'), indicator: 'orange'})
+                })
+            );
+        });
+    },
 });
@@ -1,9 +1,37 @@
 # Copyright (c) 2025, Ameer Babu and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
+from frappe.utils import cint
+
+from validation.validation.doctype.private_dictionary.private_dictionary import clear_replacement_plans
+
+# Singles whose Check fields are shipped to the desk as frappe.boot.automation_settings
+AUTOMATION_SETTINGS_DOCTYPES = ("Settings for Automation", "Automation Settings")
 
 
 class SettingsforAutomation(Document):
-	pass
+	def on_update(self):
+		clear_replacement_plans()
+		publish_automation_settings(self)
+
+
+def get_automation_flags(updated_doc=None):
+	"""Check fields of both automation singles, as {doctype: {fieldname: 0 or 1}}."""
+	flags = {}
+	for doctype in AUTOMATION_SETTINGS_DOCTYPES:
+		doc = updated_doc if updated_doc and updated_doc.doctype == doctype else frappe.get_cached_doc(doctype)
+		flags[doctype] = {df.fieldname: cint(doc.get(df.fieldname)) for df in doc.meta.fields if df.fieldtype == "Check"}
+	return flags
+
+
+def boot_session(bootinfo):
+	bootinfo.automation_settings = get_automation_flags()
+
+
+def publish_automation_settings(doc):
+	"""Push the new flags to every open desk session of the site."""
+	# Boot info is cached per user, so sessions loaded later would get the old flags
+	frappe.cache().delete_key("bootinfo")
+	frappe.publish_realtime("automation_settings_updated", get_automation_flags(doc), after_commit=True)
@@ -0,0 +1,112 @@
+"""
+Query plans and timings of the Document Time Tracking source queries, before
+and after the indexes from add_source_indexes, on a seeded dataset.
+
+It drops and re-adds indexes, so run it on a local development site only:
+
+    bench --site dev.localhost execute \
+        validation.validation.report.document_time_tracking.benchmark.run \
+        --kwargs "{'rows': 200000}"
+"""
+
+import random
+import time
+
+import frappe
+from frappe.utils import add_days, add_to_date, now_datetime, today
+
+from validation.validation.report.document_time_tracking.document_time_tracking import (
+    SOURCE_INDEXES,
+    add_source_indexes,
+    get_activity_query,
+    get_route_slug,
+    get_source_index_name,
+)
+
+# Seeded rows are owned by these users, which is also how they are removed
+SEED_USER = "time-tracking-bench-{0}@example.com"
+SEED_USERS = 20
+SEED_DOCTYPES = ("Sales Order", "Sales Invoice", "Customer", "Item", "Quotation")
+
+
+def run(rows=100000, days=365):
+    if not frappe.conf.developer_mode:
+        frappe.throw("Run the time tracking benchmark on a local developer site")
+
+    seed(rows, days)
+    scenarios = {
+        "one user, last 30 days": {"user": SEED_USER.format(0), "from_date": add_days(today(), -30), "to_date": today()},
+        "one doctype, last 30 days": {"document_type": "Sales Order", "from_date": add_days(today(), -30), "to_date": today()},
+        "user and doctype, full year": {"user": SEED_USER.format(1), "document_type": "Customer"},
+    }
+
+    try:
+        drop_source_indexes()
+        before = measure(scenarios)
+        add_source_indexes()
+        after = measure(scenarios)
+    finally:
+        remove_seed()
+        add_source_indexes()
+        frappe.db.commit()
+
+    for scenario in scenarios:
+        print(f"\n== {scenario}")
+        for label, results in (("before", before), ("after", after)):
+            seconds, plan = results[scenario]
+            print(f"-- {label}: {seconds:.3f}s")
+            for step in plan:
+                print(
+                    f"   {step.get('table') or '':<20} {step.get('type') or '':<8} "
+                    f"key={step.get('key')} rows={step.get('rows')} {step.get('Extra') or ''}"
+                )
+
+
+def measure(scenarios):
+    results = {}
+    for scenario, filters in scenarios.items():
+        query, values = get_activity_query(filters)
+        plan = frappe.db.sql(f"EXPLAIN {query}", values, as_dict=True)
+
+        started = time.monotonic()
+        frappe.db.sql(query, values)
+        results[scenario] = (time.monotonic() - started, plan)
+    return results
+
+
+def seed(rows, days):
+    now = now_datetime()
+    activity, versions, routes = [], [], []
+
+    for i in range(rows):
+        creation = add_to_date(now, minutes=-random.randint(0, days * 24 * 60))
+        user = SEED_USER.format(random.randrange(SEED_USERS))
+        doctype = random.choice(SEED_DOCTYPES)
+        docname = f"BENCH-{random.randrange(rows // 10 or 1):06d}"
+        common = (frappe.generate_hash(length=12), creation, creation, user, user)
+
+        if i % 3 == 0:
+            activity.append((*common, doctype, docname, "Benchmark", user))
+        elif i % 3 == 1:
+            versions.append((*common, doctype, docname, "{}"))
+        else:
+            routes.append((*common, user, f"app/{get_route_slug(doctype)}/{docname}"))
+
+    base = ["name", "creation", "modified", "owner", "modified_by"]
+    frappe.db.bulk_insert("Activity Log", [*base, "reference_doctype", "reference_name", "subject", "user"], activity)
+    frappe.db.bulk_insert("Version", [*base, "ref_doctype", "docname", "data"], versions)
+    frappe.db.bulk_insert("Route History", [*base, "user", "route"], routes)
+    frappe.db.commit()
+
+
+def remove_seed():
+    pattern = SEED_USER.format("%")
+    for doctype in ("Activity Log", "Version", "Route History"):
+        frappe.db.sql(f"delete from `tab{doctype}` where owner like %s", pattern)
+
+
+def drop_source_indexes():
+    for doctype, fields in SOURCE_INDEXES:
+        index_name = get_source_index_name(fields)
+        if frappe.db.has_index(f"tab{doctype}", index_name):
+            frappe.db.sql_ddl(f"alter table `tab{doctype}` drop index `{index_name}`")
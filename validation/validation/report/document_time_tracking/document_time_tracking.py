@@ -3,6 +3,29 @@ from frappe import _
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+from validation.validation.doctype.document_time_rollup.document_time_rollup import get_rollup_watermark, merge_session
+
+# A gap longer than this between two activities starts a new session
+SESSION_TIMEOUT = timedelta(minutes=30)
+
+# Minutes credited for the activity that ends a session
+SESSION_TAIL_MINUTES = 2
+
+# Indexes for the user/DocType + creation range filters on each source
+SOURCE_INDEXES = (
+    ("Activity Log", ["owner", "creation"]),
+    ("Activity Log", ["reference_doctype", "creation"]),
+    ("Version", ["owner", "creation"]),
+    ("Version", ["ref_doctype", "creation"]),
+    ("Route History", ["user", "creation"]),
+    ("Route History", ["route", "creation"]),
+)
+
+# Usage ranking behind the Document Type filter; recomputed once older than the TTL
+DOCTYPE_RANKING_KEY = "document_time_tracking_doctype_ranking"
+DOCTYPE_RANKING_TTL = timedelta(minutes=5)
+DOCTYPE_RANKING_EXPIRY = 24 * 60 * 60
+
 def execute(filters=None):
     """
     Report to track time spent by users on documents
@@ -24,7 +47,7 @@ def execute(filters=None):
     else:
         columns = get_columns()
         data = get_data(filters)
-    
+
     return columns, data
 
 def get_columns():
@@ -98,160 +121,21 @@ def get_data(filters):
     """Get detailed time tracking data from multiple sources"""
     if not filters:
         filters = {}
-    
-    user_filter = filters.get("user")
-    from_date = filters.get("from_date")
-    to_date = filters.get("to_date")
-    document_type = filters.get("document_type")
-    
-    # Dictionary to store aggregated data
-    user_doc_data = defaultdict(lambda: {
-        "first_access": None,
-        "last_access": None,
-        "activities": []
-    })
-    
-    # 1. Get data from Activity Log
-    activity_conditions = ["reference_doctype IS NOT NULL", "reference_name IS NOT NULL"]
-    if user_filter:
-        activity_conditions.append(f"owner = {frappe.db.escape(user_filter, percent=False)}")
-    if from_date:
-        activity_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-    if to_date:
-        activity_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-    if document_type:
-        activity_conditions.append(f"reference_doctype = {frappe.db.escape(document_type, percent=False)}")
-    
-    try:
-        activity_data = frappe.db.sql(f"""
-            SELECT 
-                owner as user,
-                reference_doctype as doctype,
-                reference_name as docname,
-                creation,
-                operation
-            FROM `tabActivity Log`
-            WHERE {' AND '.join(activity_conditions)}
-            ORDER BY creation
-        """, as_dict=1)
-    except Exception as e:
-        frappe.log_error(f"Error fetching activity log: {str(e)}")
-        activity_data = []
-    
-    for activity in activity_data:
-        if not activity.user or not activity.doctype or not activity.docname:
-            continue
-            
-        key = (activity.user, activity.doctype, activity.docname)
-        user_doc_data[key]["activities"].append(activity.creation)
-        
-        if not user_doc_data[key]["first_access"] or activity.creation < user_doc_data[key]["first_access"]:
-            user_doc_data[key]["first_access"] = activity.creation
-        if not user_doc_data[key]["last_access"] or activity.creation > user_doc_data[key]["last_access"]:
-            user_doc_data[key]["last_access"] = activity.creation
-    
-    # 2. Get data from Version (document modifications)
-    version_conditions = ["ref_doctype IS NOT NULL", "docname IS NOT NULL"]
-    if user_filter:
-        version_conditions.append(f"owner = {frappe.db.escape(user_filter, percent=False)}")
-    if from_date:
-        version_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-    if to_date:
-        version_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-    if document_type:
-        version_conditions.append(f"ref_doctype = {frappe.db.escape(document_type, percent=False)}")
-    
-    where_clause = f"WHERE {' AND '.join(version_conditions)}"
-    
-    try:
-        version_data = frappe.db.sql(f"""
-            SELECT 
-                owner as user,
-                ref_doctype as doctype,
-                docname,
-                creation
-            FROM `tabVersion`
-            {where_clause}
-            ORDER BY creation
-        """, as_dict=1)
-    except Exception as e:
-        frappe.log_error(f"Error fetching version data: {str(e)}")
-        version_data = []
-    
-    for version in version_data:
-        if not version.user or not version.doctype or not version.docname:
-            continue
-            
-        key = (version.user, version.doctype, version.docname)
-        user_doc_data[key]["activities"].append(version.creation)
-        
-        if not user_doc_data[key]["first_access"] or version.creation < user_doc_data[key]["first_access"]:
-            user_doc_data[key]["first_access"] = version.creation
-        if not user_doc_data[key]["last_access"] or version.creation > user_doc_data[key]["last_access"]:
-            user_doc_data[key]["last_access"] = version.creation
-    
-    # 3. Get data from Route History (if available)
-    try:
-        route_conditions = ["route IS NOT NULL", "user IS NOT NULL"]
-        if user_filter:
-            route_conditions.append(f"user = {frappe.db.escape(user_filter, percent=False)}")
-        if from_date:
-            route_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-        if to_date:
-            route_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-        
-        where_clause = f"WHERE {' AND '.join(route_conditions)}"
-        
-        route_data = frappe.db.sql(f"""
-            SELECT 
-                user,
-                route,
-                creation
-            FROM `tabRoute History`
-            {where_clause}
-            ORDER BY creation
-        """, as_dict=1)
-        
-        for route in route_data:
-            # Parse route to get doctype and docname
-            route_parts = route.route.strip('/').split('/')
-            if len(route_parts) >= 3 and route_parts[0] == 'app':
-                doctype = route_parts[1].replace('-', ' ').title()
-                docname = route_parts[2]
-                
-                if document_type and doctype != document_type:
-                    continue
-                
-                key = (route.user, doctype, docname)
-                user_doc_data[key]["activities"].append(route.creation)
-                
-                if not user_doc_data[key]["first_access"] or route.creation < user_doc_data[key]["first_access"]:
-                    user_doc_data[key]["first_access"] = route.creation
-                if not user_doc_data[key]["last_access"] or route.creation > user_doc_data[key]["last_access"]:
-                    user_doc_data[key]["last_access"] = route.creation
-    except Exception as e:
-        # Route History table might not exist
-        pass
-    
-    # 4. Calculate time spent and prepare final data
+
+    # Calculate time spent and prepare final data
     result = []
     total_duration_minutes = 0
-    
-    for (user, doctype, docname), data in user_doc_data.items():
-        # Calculate time spent based on activity timestamps
-        total_minutes = calculate_time_spent(data["activities"])
+
+    for user, doctype, docname, first_access, last_access, total_minutes in get_document_sessions(filters):
         total_duration_minutes += total_minutes
-        
-        # Format time as HH:MM:SS
-        time_display = format_time_display(total_minutes)
-        
+
         result.append({
             "user": user,
             "document_type": doctype,
             "document_name": docname,
-            "first_access": data["first_access"],
-            "last_access": data["last_access"],
-            "total_time_minutes": time_display,
+            "first_access": first_access,
+            "last_access": last_access,
+            "total_time_minutes": format_time_display(total_minutes),
             "_total_minutes": total_minutes
         })
     
@@ -280,121 +164,18 @@ def get_consolidated_data(filters):
     """Get consolidated time tracking data grouped by user and document type"""
     if not filters:
         filters = {}
-    
-    user_filter = filters.get("user")
-    from_date = filters.get("from_date")
-    to_date = filters.get("to_date")
-    document_type = filters.get("document_type")
-    
-    # Dictionary to store activities by user and doctype
-    user_doctype_activities = defaultdict(list)
-    
-    # 1. Get data from Activity Log
-    activity_conditions = ["reference_doctype IS NOT NULL", "reference_name IS NOT NULL"]
-    if user_filter:
-        activity_conditions.append(f"owner = {frappe.db.escape(user_filter, percent=False)}")
-    if from_date:
-        activity_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-    if to_date:
-        activity_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-    if document_type:
-        activity_conditions.append(f"reference_doctype = {frappe.db.escape(document_type, percent=False)}")
-    
-    try:
-        activity_data = frappe.db.sql(f"""
-            SELECT 
-                owner as user,
-                reference_doctype as doctype,
-                creation
-            FROM `tabActivity Log`
-            WHERE {' AND '.join(activity_conditions)}
-            ORDER BY creation
-        """, as_dict=1)
-        
-        for activity in activity_data:
-            if not activity.user or not activity.doctype:
-                continue
-            key = (activity.user, activity.doctype)
-            user_doctype_activities[key].append(activity.creation)
-    except Exception as e:
-        frappe.log_error(f"Error fetching activity log: {str(e)}")
-    
-    # 2. Get data from Version
-    version_conditions = ["ref_doctype IS NOT NULL", "docname IS NOT NULL"]
-    if user_filter:
-        version_conditions.append(f"owner = {frappe.db.escape(user_filter, percent=False)}")
-    if from_date:
-        version_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-    if to_date:
-        version_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-    if document_type:
-        version_conditions.append(f"ref_doctype = {frappe.db.escape(document_type, percent=False)}")
-    
-    try:
-        version_data = frappe.db.sql(f"""
-            SELECT 
-                owner as user,
-                ref_doctype as doctype,
-                creation
-            FROM `tabVersion`
-            WHERE {' AND '.join(version_conditions)}
-            ORDER BY creation
-        """, as_dict=1)
-        
-        for version in version_data:
-            if not version.user or not version.doctype:
-                continue
-            key = (version.user, version.doctype)
-            user_doctype_activities[key].append(version.creation)
-    except Exception as e:
-        frappe.log_error(f"Error fetching version data: {str(e)}")
-    
-    # 3. Get data from Route History
-    try:
-        route_conditions = ["route IS NOT NULL", "user IS NOT NULL"]
-        if user_filter:
-            route_conditions.append(f"user = {frappe.db.escape(user_filter, percent=False)}")
-        if from_date:
-            route_conditions.append(f"creation >= {frappe.db.escape(str(from_date), percent=False)}")
-        if to_date:
-            route_conditions.append(f"creation <= {frappe.db.escape(str(to_date), percent=False)}")
-        
-        route_data = frappe.db.sql(f"""
-            SELECT 
-                user,
-                route,
-                creation
-            FROM `tabRoute History`
-            WHERE {' AND '.join(route_conditions)}
-            ORDER BY creation
-        """, as_dict=1)
-        
-        for route in route_data:
-            route_parts = route.route.strip('/').split('/')
-            if len(route_parts) >= 3 and route_parts[0] == 'app':
-                doctype = route_parts[1].replace('-', ' ').title()
-                
-                if document_type and doctype != document_type:
-                    continue
-                
-                key = (route.user, doctype)
-                user_doctype_activities[key].append(route.creation)
-    except Exception as e:
-        pass
-    
+
     # Calculate consolidated time and prepare result
     result = []
     total_duration_minutes = 0
-    
-    for (user, doctype), activities in user_doctype_activities.items():
-        total_minutes = calculate_time_spent(activities)
+
+    for user, doctype, _docname, _first, _last, total_minutes in get_document_sessions(filters, consolidate=True):
         total_duration_minutes += total_minutes
-        time_display = format_time_display(total_minutes)
-        
+
         result.append({
             "user": user,
             "document_type": doctype,
-            "total_time_minutes": time_display,
+            "total_time_minutes": format_time_display(total_minutes),
             "_total_minutes": total_minutes
         })
     
@@ -416,6 +197,201 @@ def get_consolidated_data(filters):
     
     return result
 
+def get_document_sessions(filters, consolidate=False):
+    """
+    Yield (user, doctype, docname, first_access, last_access, minutes) per
+    document, or per DocType with docname None when consolidating.
+
+    Reads the Document Time Rollup once it has been built, with the raw
+    activity logged after its watermark merged on top, and computes sessions
+    from the raw logs alone before that.
+    """
+    watermark = get_rollup_watermark()
+
+    sessions = SessionAccumulator()
+    for _source, user, doctype, docname, creation in iter_activity(filters, after=watermark):
+        sessions.add((user, doctype, None if consolidate else docname), creation)
+
+    if watermark:
+        for row in get_rollup_sessions(filters, consolidate):
+            key = (row.user, row.reference_doctype, row.reference_name or None)
+            # Left without its tail, as the rollup row already credits one
+            recent = sessions.sessions.pop(key, None)
+            if recent:
+                row.update(merge_session(row, *recent))
+            yield *key, row.first_access, row.last_access, row.session_minutes
+
+    for (user, doctype, docname), (first_access, last_access, minutes, _events) in sessions.items():
+        yield user, doctype, docname, first_access, last_access, minutes
+
+def get_rollup_sessions(filters, consolidate=False):
+    """Sum the daily rollup rows over the filtered date range"""
+    conditions = ["reference_name = ''" if consolidate else "reference_name != ''"]
+    values = {}
+
+    if filters.get("user"):
+        conditions.append("user = %(user)s")
+        values["user"] = filters.get("user")
+    if filters.get("from_date"):
+        conditions.append("date >= %(from_date)s")
+        values["from_date"] = filters.get("from_date")
+    if filters.get("to_date"):
+        conditions.append("date < %(before_date)s")
+        values["before_date"] = get_before_date(filters.get("to_date"))
+    if filters.get("document_type"):
+        conditions.append("reference_doctype = %(document_type)s")
+        values["document_type"] = filters.get("document_type")
+
+    return frappe.db.sql(f"""
+        SELECT
+            user,
+            reference_doctype,
+            reference_name,
+            MIN(first_access) AS first_access,
+            MAX(last_access) AS last_access,
+            SUM(session_minutes) AS session_minutes,
+            SUM(event_count) AS event_count
+        FROM `tabDocument Time Rollup`
+        WHERE {' AND '.join(conditions)}
+        GROUP BY user, reference_doctype, reference_name
+    """, values, as_dict=True)
+
+def iter_activity(filters, after=None, until=None):
+    """
+    Yield (source, user, doctype, docname, creation) from Activity Log, Version
+    and Route History as one stream ordered by creation.
+
+    The three sources are merged by a single UNION ALL and read through an
+    unbuffered cursor, so rows are never all held in memory at once. `after`
+    and `until` bound creation as (after, until], for incremental readers.
+    """
+    query, values = get_activity_query(filters, after, until)
+
+    # Route History only knows the URL slug of a DocType
+    doctype_by_slug = {get_route_slug(name): name for name in frappe.get_all("DocType", pluck="name")}
+
+    with frappe.db.unbuffered_cursor():
+        for source, user, doctype, docname, creation in frappe.db.sql(query, values, as_iterator=True):
+            if source == "Route History":
+                if not docname:
+                    continue
+                doctype = doctype_by_slug.get(doctype) or doctype.replace('-', ' ').title()
+
+            yield source, user, doctype, docname, creation
+
+def get_activity_query(filters, after=None, until=None):
+    """The UNION ALL behind iter_activity, as (query, values)"""
+    user_filter = filters.get("user")
+    from_date = filters.get("from_date")
+    to_date = filters.get("to_date")
+    document_type = filters.get("document_type")
+
+    values = {"route_prefix": "app/%/%"}
+    activity_conditions = ["reference_doctype IS NOT NULL", "reference_name IS NOT NULL", "owner IS NOT NULL"]
+    version_conditions = ["ref_doctype IS NOT NULL", "docname IS NOT NULL", "owner IS NOT NULL"]
+    # Only desk form routes (app/<doctype-slug>/<name>) point at a document
+    route_conditions = ["route LIKE %(route_prefix)s", "user IS NOT NULL"]
+
+    if user_filter:
+        values["user"] = user_filter
+        activity_conditions.append("owner = %(user)s")
+        version_conditions.append("owner = %(user)s")
+        route_conditions.append("user = %(user)s")
+    if from_date:
+        values["from_date"] = str(from_date)
+        for conditions in (activity_conditions, version_conditions, route_conditions):
+            conditions.append("creation >= %(from_date)s")
+    if to_date:
+        values["before_date"] = get_before_date(to_date)
+        for conditions in (activity_conditions, version_conditions, route_conditions):
+            conditions.append("creation < %(before_date)s")
+    if after:
+        values["after"] = after
+        for conditions in (activity_conditions, version_conditions, route_conditions):
+            conditions.append("creation > %(after)s")
+    if until:
+        values["until"] = until
+        for conditions in (activity_conditions, version_conditions, route_conditions):
+            conditions.append("creation <= %(until)s")
+    if document_type:
+        values["document_type"] = document_type
+        values["route_prefix"] = f"app/{escape_like(get_route_slug(document_type))}/%"
+        activity_conditions.append("reference_doctype = %(document_type)s")
+        version_conditions.append("ref_doctype = %(document_type)s")
+
+    # Route History rows carry the DocType slug in place of the DocType
+    query = f"""
+        SELECT 'Activity Log' AS source, owner AS user, reference_doctype AS doctype,
+            reference_name AS docname, creation
+        FROM `tabActivity Log`
+        WHERE {' AND '.join(activity_conditions)}
+        UNION ALL
+        SELECT 'Version', owner, ref_doctype, docname, creation
+        FROM `tabVersion`
+        WHERE {' AND '.join(version_conditions)}
+        UNION ALL
+        SELECT 'Route History', user,
+            SUBSTRING_INDEX(SUBSTRING_INDEX(route, '/', 2), '/', -1),
+            SUBSTRING_INDEX(SUBSTRING_INDEX(route, '/', 3), '/', -1),
+            creation
+        FROM `tabRoute History`
+        WHERE {' AND '.join(route_conditions)}
+        ORDER BY creation
+    """
+    return query, values
+
+def get_before_date(to_date):
+    """Exclusive upper bound covering all of `to_date`, shared by the rollup and raw queries"""
+    return str(frappe.utils.add_days(frappe.utils.getdate(to_date), 1))
+
+def get_route_slug(doctype):
+    """URL slug of a DocType in desk routes, e.g. Sales Order -> sales-order"""
+    return doctype.lower().replace(' ', '-')
+
+def escape_like(text):
+    """Escape the LIKE wildcards in `text`, so it only matches itself"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def add_source_indexes():
+    """
+    Add the composite indexes the time tracking queries filter on.
+    Runs after every migrate, so they are restored if a table is rebuilt.
+    """
+    for doctype, fields in SOURCE_INDEXES:
+        frappe.db.add_index(doctype, fields, get_source_index_name(fields))
+
+def get_source_index_name(fields):
+    return "_".join(fields) + "_index"
+
+class SessionAccumulator:
+    """
+    Session time per key, computed in a single pass over timestamps that
+    arrive in ascending order. Matches calculate_time_spent while keeping
+    only [first, last, minutes, events] per key.
+    """
+
+    def __init__(self):
+        self.sessions = {}
+
+    def add(self, key, timestamp):
+        state = self.sessions.get(key)
+        if state is None:
+            self.sessions[key] = [timestamp, timestamp, 0.0, 1]
+            return
+
+        gap = timestamp - state[1]
+        state[2] += gap.total_seconds() / 60 if gap <= SESSION_TIMEOUT else SESSION_TAIL_MINUTES
+        state[1] = timestamp
+        state[3] += 1
+
+    def items(self, tail=True):
+        """
+        Yield key, (first, last, total minutes, events). The tail of the last
+        session is left out with tail=False, for totals that are merged later.
+        """
+        for key, (first, last, minutes, events) in self.sessions.items():
+            yield key, (first, last, minutes + SESSION_TAIL_MINUTES if tail else minutes, events)
+
 def format_time_display(total_minutes):
     """
     Format time as HH:MM:SS
@@ -441,18 +417,17 @@ def calculate_time_spent(activities):
     
     activities = sorted(activities)
     total_minutes = 0
-    session_timeout = timedelta(minutes=30)
     
     for i in range(len(activities) - 1):
         time_diff = activities[i + 1] - activities[i]
         
-        if time_diff <= session_timeout:
+        if time_diff <= SESSION_TIMEOUT:
             total_minutes += time_diff.total_seconds() / 60
         else:
-            total_minutes += 2
+            total_minutes += SESSION_TAIL_MINUTES
     
     # Add minimum 2 minutes for the last activity
-    total_minutes += 2
+    total_minutes += SESSION_TAIL_MINUTES
     
     return total_minutes
 
@@ -529,98 +504,61 @@ def parse_time_to_minutes(time_str):
 def get_doctype_list(doctype, txt, searchfield, start, page_len, filters):
     """
     Get list of doctypes sorted by usage frequency (total time spent)
+
+    Served from a cached ranking. A stale ranking is still served while a
+    background job refreshes it; with no ranking cached at all, this falls
+    back to a plain DocType name search.
     """
-    # Get date range from current user's session or use defaults
-    from_date = frappe.utils.add_days(frappe.utils.today(), -30)
-    to_date = frappe.utils.today()
-    
-    # Dictionary to store time per doctype
-    doctype_time = defaultdict(float)
-    
-    # Get data from Activity Log
-    try:
-        activity_data = frappe.db.sql("""
-            SELECT 
-                reference_doctype as doctype,
-                creation
-            FROM `tabActivity Log`
-            WHERE reference_doctype IS NOT NULL 
-                AND reference_name IS NOT NULL
-                AND creation >= %s
-                AND creation <= %s
-            ORDER BY creation
-        """, (from_date, to_date), as_dict=1)
-        
-        # Group by doctype and calculate time
-        doctype_activities = defaultdict(list)
-        for activity in activity_data:
-            if activity.doctype:
-                doctype_activities[activity.doctype].append(activity.creation)
-        
-        for doctype_name, activities in doctype_activities.items():
-            doctype_time[doctype_name] += calculate_time_spent(activities)
-    except:
-        pass
-    
-    # Get data from Version
-    try:
-        version_data = frappe.db.sql("""
-            SELECT 
-                ref_doctype as doctype,
-                creation
-            FROM `tabVersion`
-            WHERE ref_doctype IS NOT NULL 
-                AND docname IS NOT NULL
-                AND creation >= %s
-                AND creation <= %s
-            ORDER BY creation
-        """, (from_date, to_date), as_dict=1)
-        
-        doctype_activities = defaultdict(list)
-        for version in version_data:
-            if version.doctype:
-                doctype_activities[version.doctype].append(version.creation)
-        
-        for doctype_name, activities in doctype_activities.items():
-            doctype_time[doctype_name] += calculate_time_spent(activities)
-    except:
-        pass
-    
-    # Get data from Route History
-    try:
-        route_data = frappe.db.sql("""
-            SELECT 
-                route,
-                creation
-            FROM `tabRoute History`
-            WHERE route IS NOT NULL 
-                AND user IS NOT NULL
-                AND creation >= %s
-                AND creation <= %s
-            ORDER BY creation
-        """, (from_date, to_date), as_dict=1)
-        
-        doctype_activities = defaultdict(list)
-        for route in route_data:
-            route_parts = route.route.strip('/').split('/')
-            if len(route_parts) >= 3 and route_parts[0] == 'app':
-                doctype_name = route_parts[1].replace('-', ' ').title()
-                doctype_activities[doctype_name].append(route.creation)
-        
-        for doctype_name, activities in doctype_activities.items():
-            doctype_time[doctype_name] += calculate_time_spent(activities)
-    except:
-        pass
-    
-    # Sort doctypes by time spent (descending)
-    sorted_doctypes = sorted(doctype_time.items(), key=lambda x: -x[1])
+    start = frappe.utils.cint(start)
+    page_len = frappe.utils.cint(page_len)
+
+    ranking = frappe.cache().get_value(DOCTYPE_RANKING_KEY)
+    if not ranking or ranking["computed_at"] < frappe.utils.now_datetime() - DOCTYPE_RANKING_TTL:
+        frappe.enqueue(
+            "validation.validation.report.document_time_tracking.document_time_tracking.refresh_doctype_ranking",
+            queue="long",
+            job_id="document_time_tracking::doctype_ranking",
+            deduplicate=True,
+        )
+
+    if not ranking:
+        return frappe.get_all(
+            "DocType",
+            filters={"name": ["like", f"%{txt or ''}%"], "istable": 0, "issingle": 0},
+            order_by="name",
+            limit_start=start,
+            limit_page_length=page_len,
+            as_list=True,
+        )
+
+    result = ranking["doctypes"]
     
     # Filter by search text if provided
     if txt:
-        sorted_doctypes = [(dt, time) for dt, time in sorted_doctypes if txt.lower() in dt.lower()]
-    
-    # Get only doctype names
-    result = [[dt] for dt, time in sorted_doctypes]
+        txt = txt.lower()
+        result = [dt for dt in result if txt in dt.lower()]
     
     # Apply pagination
-    return result[start:start + page_len] if result else []
\ No newline at end of file
+    return [[dt] for dt in result[start:start + page_len]]
+
+def refresh_doctype_ranking():
+    frappe.cache().set_value(
+        DOCTYPE_RANKING_KEY,
+        {"computed_at": frappe.utils.now_datetime(), "doctypes": get_doctype_ranking()},
+        expires_in_sec=DOCTYPE_RANKING_EXPIRY,
+    )
+
+def get_doctype_ranking():
+    """DocTypes by time spent on them over the last 30 days, highest first"""
+    from_date = frappe.utils.add_days(frappe.utils.today(), -30)
+    to_date = frappe.utils.today()
+
+    # Same per user and DocType sessions as the consolidated view, rolled up or not
+    doctype_time = defaultdict(float)
+    for _user, doctype_name, _docname, _first, _last, minutes in get_document_sessions(
+        {"from_date": from_date, "to_date": to_date}, consolidate=True
+    ):
+        doctype_time[doctype_name] += minutes
+    
+    # Sort doctypes by time spent (descending)
+    return [dt for dt, time in sorted(doctype_time.items(), key=lambda x: -x[1])]
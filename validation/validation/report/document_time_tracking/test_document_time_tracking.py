@@ -0,0 +1,92 @@
+# Copyright (c) 2025, Ameer Babu and Contributors
+# See license.txt
+
+from datetime import datetime, timedelta
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from validation.validation.report.document_time_tracking.document_time_tracking import (
+	DOCTYPE_RANKING_KEY,
+	SessionAccumulator,
+	calculate_time_spent,
+	get_activity_query,
+	get_doctype_list,
+	get_document_sessions,
+)
+from validation.validation.doctype.document_time_rollup.document_time_rollup import WATERMARK_KEY
+
+
+class TestDocumentTimeTracking(FrappeTestCase):
+	def test_accumulator_matches_calculate_time_spent(self):
+		start = datetime(2025, 1, 1, 9, 0)
+		offsets = [0, 5, 12, 60, 61, 200, 200, 229]
+		timestamps = [start + timedelta(minutes=minutes) for minutes in offsets]
+
+		sessions = SessionAccumulator()
+		for timestamp in timestamps:
+			sessions.add("key", timestamp)
+
+		((key, (first, last, minutes, events)),) = sessions.items()
+		self.assertEqual((first, last, events), (timestamps[0], timestamps[-1], len(timestamps)))
+		self.assertAlmostEqual(minutes, calculate_time_spent(timestamps))
+
+	def test_route_history_is_matched_by_route_prefix(self):
+		_query, values = get_activity_query({"document_type": "Sales Order"})
+		self.assertEqual(values["route_prefix"], "app/sales-order/%")
+
+		_query, values = get_activity_query({})
+		self.assertEqual(values["route_prefix"], "app/%/%")
+
+		# Underscores in a slug must not match any character
+		_query, values = get_activity_query({"document_type": "Item_Price"})
+		self.assertEqual(values["route_prefix"], "app/item\\_price/%")
+
+	def test_to_date_covers_the_whole_day(self):
+		_query, values = get_activity_query({"to_date": "2025-01-31"})
+		self.assertEqual(values["before_date"], "2025-02-01")
+
+	def test_activity_after_watermark_is_merged_into_rollup(self):
+		now = frappe.utils.now_datetime()
+		docname = f"_Test Rollup {frappe.generate_hash(length=8)}"
+		frappe.db.set_global(WATERMARK_KEY, str(now - timedelta(hours=1)))
+		frappe.get_doc({
+			"doctype": "Document Time Rollup",
+			"date": now.date(),
+			"user": frappe.session.user,
+			"reference_doctype": "ToDo",
+			"reference_name": docname,
+			"session_minutes": 10,
+			"first_access": now - timedelta(hours=3),
+			"last_access": now - timedelta(hours=2),
+			"event_count": 3,
+		}).insert(ignore_permissions=True)
+		frappe.get_doc({
+			"doctype": "Activity Log",
+			"subject": docname,
+			"reference_doctype": "ToDo",
+			"reference_name": docname,
+			"status": "Success",
+		}).insert(ignore_permissions=True)
+
+		sessions = {
+			docname: (last_access, minutes)
+			for _user, _doctype, docname, _first, last_access, minutes in get_document_sessions(
+				{"user": frappe.session.user, "document_type": "ToDo"}
+			)
+		}
+
+		# The new activity starts a session after the rollup's last one
+		last_access, minutes = sessions[docname]
+		self.assertGreater(last_access, now - timedelta(hours=1))
+		self.assertAlmostEqual(minutes, 12)
+
+	def test_doctype_list_pages_through_cached_ranking(self):
+		frappe.cache().set_value(
+			DOCTYPE_RANKING_KEY,
+			{"computed_at": frappe.utils.now_datetime(), "doctypes": ["Sales Order", "Item", "Sales Invoice"]},
+		)
+		self.addCleanup(frappe.cache().delete_value, DOCTYPE_RANKING_KEY)
+
+		self.assertEqual(get_doctype_list("DocType", "sales", "name", 0, 10, {}), [["Sales Order"], ["Sales Invoice"]])
+		self.assertEqual(get_doctype_list("DocType", "", "name", 1, 1, {}), [["Item"]])
@@ -0,0 +1,12 @@
+frappe.query_reports["Duplicate Parties"] = {
+    "filters": [
+        {
+            "fieldname": "party_type",
+            "label": __("Party Type"),
+            "fieldtype": "Select",
+            "options": ["Customer", "Supplier", "Contact"],
+            "default": "Customer",
+            "reqd": 1
+        }
+    ]
+};
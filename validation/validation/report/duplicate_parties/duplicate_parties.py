@@ -0,0 +1,76 @@
+import frappe
+from frappe import _
+
+from validation.customization.party_dedupe import KEY_FIELD, PARTY_NAME_FIELDS
+
+
+def execute(filters=None):
+    """
+    Customers, Suppliers or Contacts sharing a normalized name, one group per key,
+    oldest record first so the one to keep is at the top of each group.
+    """
+    filters = filters or {}
+    party_type = filters.get("party_type") or "Customer"
+    if party_type not in PARTY_NAME_FIELDS:
+        frappe.throw(_("Duplicates can only be listed for {0}").format(", ".join(PARTY_NAME_FIELDS)))
+
+    frappe.has_permission(party_type, "read", throw=True)
+
+    return get_columns(party_type), get_data(party_type)
+
+
+def get_columns(party_type):
+    return [
+        {
+            "fieldname": "normalized_name",
+            "label": _("Normalized Name"),
+            "fieldtype": "Data",
+            "width": 250
+        },
+        {
+            "fieldname": "party",
+            "label": _(party_type),
+            "fieldtype": "Link",
+            "options": party_type,
+            "width": 200
+        },
+        {
+            "fieldname": "party_name",
+            "label": _("Name"),
+            "fieldtype": "Data",
+            "width": 250
+        },
+        {
+            "fieldname": "group_size",
+            "label": _("Records"),
+            "fieldtype": "Int",
+            "width": 100
+        },
+        {
+            "fieldname": "creation",
+            "label": _("Created On"),
+            "fieldtype": "Datetime",
+            "width": 180
+        }
+    ]
+
+
+def get_data(party_type):
+    """Group by the indexed key in the database; only members of duplicate groups come back."""
+    title_field = PARTY_NAME_FIELDS[party_type]
+    return frappe.db.sql(
+        f"""
+        select party.`{KEY_FIELD}` as normalized_name, party.name as party,
+            party.`{title_field}` as party_name, duplicates.group_size, party.creation
+        from `tab{party_type}` party
+        join (
+            select `{KEY_FIELD}` as normalized_name, count(*) as group_size
+            from `tab{party_type}`
+            where ifnull(`{KEY_FIELD}`, '') != ''
+            group by `{KEY_FIELD}`
+            having count(*) > 1
+        ) duplicates on duplicates.normalized_name = party.`{KEY_FIELD}`
+        order by duplicates.group_size desc, party.`{KEY_FIELD}`, party.creation
+        """,
+        as_dict=True,
+    )